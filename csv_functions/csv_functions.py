@@ -1,7 +1,37 @@
 import csv  # https://docs.python.org/3/library/csv.html
-from random import randint
+import hashlib
+import heapq
+import io
+import json
+import locale
+import math
+import mmap
+import multiprocessing
+import operator
+import os
+import pickle
+import queue
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from array import array
+from collections import namedtuple
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import date
+from functools import lru_cache, partial
+from itertools import chain, islice
+from random import randint, random as random_float
 from pprint import pprint as pp
 
+try:
+    import numpy as np  # https://numpy.org/ - This module is not build-in with Python
+except ImportError:
+    np = None
+
 
 def read_csv(
     file_path: str, delimiter: str = ";", mode: str = "r", encoding: str | None = None
@@ -28,8 +58,42 @@ def read_csv(
     return matrix
 
 
+def iter_csv(
+    file_path: str,
+    delimiter: str = ";",
+    encoding: str | None = None,
+    batch_size: int = 0,
+) -> Iterator[list]:
+    """Iterate over the rows of a CSV file without loading the whole file into memory.
+
+    The file is only read as far as the rows are consumed, stopping the iteration early (e.g. `break`) closes the file without reading the remaining rows.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `batch_size` (`int`, optional): An integer representing the number of rows per yielded batch, `0` yields the rows one at a time. Defaults to `0`.
+
+    Returns:
+        -   `Iterator[list]`: An iterator of rows (lists), or of batches (matrices) if a batch size is given.
+    """
+    # Open the file from the given path in the read mode
+    with open(file_path, "r", encoding=encoding) as f:
+        # Create a CSV reader
+        reader = csv.reader(f, delimiter=delimiter)
+        # Yield each row (or batch of rows) from the CSV file
+        if batch_size > 0:
+            yield from _batched(reader, batch_size)
+        else:
+            yield from reader
+
+
 def write_csv(
-    matrix: list[list], file_path: str, delimiter: str = ";", mode: str = "w"
+    matrix: list[list],
+    file_path: str,
+    delimiter: str = ";",
+    mode: str = "w",
+    encoding: str | None = None,
 ) -> str:
     """Write a matrix into a CSV file. A matrix is a list of lists (2D-array).
 
@@ -38,12 +102,13 @@ def write_csv(
         -   `file_path` (`str`): A string representing the destination file path.
         -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
         -   `mode` (`str`, optional): A string representing the mode in which the file is opened (e.g. `"w"` for write, `"a"` for append). Defaults to `"w"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
 
     Returns:
         -   `str`: A string representing the destination file path.
     """
     # Open the file from the given path in the specified mode
-    with open(file_path, mode) as f:
+    with open(file_path, mode, encoding=encoding) as f:
         # Create a CSV writer
         writer = csv.writer(f, delimiter=delimiter)
         # Write each row from the matrix to the CSV file
@@ -95,15 +160,323 @@ def append_csv_record(
     return file_path
 
 
+class CsvAppender:
+    """Append dictionary records to a CSV file through a long-lived, buffered CSV writer.
+
+    The file handle and the CSV writer stay open for the lifetime of the appender, records are buffered and written to the file at once when one of the flush policies is met (number of rows, buffered size in characters or seconds since the last flush, `0` disables a policy).
+    The time policy is checked when a record is appended, call `flush()` to write the buffered records explicitly.
+    Use the appender as a context manager (`with CsvAppender(...) as appender:`) or call `close()` to flush the remaining records and close the file.
+
+    Args:
+        -   `file_path` (`str`): A string representing the destination file path.
+        -   `field_names` (`list[str]`): A list of strings representing the field names.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `max_rows` (`int`, optional): An integer representing the number of buffered records that triggers a flush. Defaults to `10000`.
+        -   `max_size` (`int`, optional): An integer representing the buffered size (in characters) that triggers a flush. Defaults to `1048576` (1 MiB).
+        -   `max_seconds` (`float`, optional): A float representing the number of seconds since the last flush that triggers a flush. Defaults to `5.0`.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        field_names: list[str],
+        delimiter: str = ";",
+        encoding: str | None = None,
+        max_rows: int = 10000,
+        max_size: int = 1024 * 1024,
+        max_seconds: float = 5.0,
+    ) -> None:
+        self.file_path: str = file_path
+        self.max_rows: int = max_rows
+        self.max_size: int = max_size
+        self.max_seconds: float = max_seconds
+        # Open the file from the given path in the append mode
+        self._file = open(file_path, "a", encoding=encoding)
+        # Create a CSV writer on an in-memory buffer
+        self._buffer = io.StringIO()
+        self._writer = csv.DictWriter(
+            self._buffer, fieldnames=field_names, delimiter=delimiter
+        )
+        self._rows: int = 0
+        self._last_flush: float = time.monotonic()
+
+    def __enter__(self) -> "CsvAppender":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def append(self, record: dict) -> None:
+        """Append a dictionary record to the buffer, flush the buffer if a flush policy is met."""
+        self._writer.writerow(record)
+        self._rows += 1
+        self._check_flush()
+
+    def extend(self, records: Iterable[dict]) -> None:
+        """Append multiple dictionary records to the buffer, flush the buffer if a flush policy is met."""
+        for record in records:
+            self._writer.writerow(record)
+            self._rows += 1
+            if self._rows >= self.max_rows > 0:
+                self.flush()
+        self._check_flush()
+
+    def flush(self) -> None:
+        """Write the buffered records to the CSV file."""
+        if self._rows:
+            self._file.write(self._buffer.getvalue())
+            self._file.flush()
+            # Reset the buffer
+            self._buffer.seek(0)
+            self._buffer.truncate()
+            self._rows = 0
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush the buffered records and close the CSV file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def _check_flush(self) -> None:
+        if (
+            self._rows >= self.max_rows > 0
+            or self._buffer.tell() >= self.max_size > 0
+            or time.monotonic() - self._last_flush >= self.max_seconds > 0
+        ):
+            self.flush()
+
+
+class CsvWriterService:
+    """Write the records of multiple (concurrent) producers to a single CSV file, using one writer thread.
+
+    Producers (threads, or processes using a `CsvProducer` from `producer()`) push records (dictionaries or lists) onto a bounded queue, the writer thread writes the queued records in large batches, in the order they are received.
+    Pushing blocks while the queue is full (backpressure), use `stats()` for the throughput counters and `close()` (or a `with` statement) to write the remaining records and stop the writer thread.
+    Dictionary records are checked against the field names when they are pushed, so a malformed record raises in its producer instead of stopping the writer thread.
+    If writing fails anyway, the writer thread discards the queued records (so producers do not block), pushing raises an error (in all producers) and closing raises the error.
+    A `multiprocessing.Queue` can only be passed to processes when they are created (e.g. `multiprocessing.Process` arguments), use `use_manager=True` for process pools.
+
+    Args:
+        -   `file_path` (`str`): A string representing the destination file path.
+        -   `field_names` (`list[str] | None`, optional): A list of strings representing the field names of dictionary records, `None` if all records are lists. Defaults to `None`.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `mode` (`str`, optional): A string representing the mode in which the file is opened (e.g. `"w"` for write, `"a"` for append). Defaults to `"a"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `max_queue` (`int`, optional): An integer representing the maximum number of queued items (records or lists of records). Defaults to `10000`.
+        -   `batch_size` (`int`, optional): An integer representing the maximum number of queued items written at once. Defaults to `1000`.
+        -   `use_manager` (`bool`, optional): A boolean, `True` to use a (picklable) `multiprocessing.Manager` queue. Defaults to `False`.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        field_names: list[str] | None = None,
+        delimiter: str = ";",
+        mode: str = "a",
+        encoding: str | None = None,
+        max_queue: int = 10000,
+        batch_size: int = 1000,
+        use_manager: bool = False,
+    ) -> None:
+        self.file_path: str = file_path
+        self.batch_size: int = batch_size
+        self._manager = multiprocessing.Manager() if use_manager else None
+        if self._manager is not None:
+            self.queue = self._manager.Queue(max_queue)
+            self._failed = self._manager.Event()
+        else:
+            self.queue = multiprocessing.Queue(max_queue)
+            self._failed = multiprocessing.Event()
+        self._field_names: list[str] | None = field_names
+        self._file = open(file_path, mode, encoding=encoding)
+        self._writer = csv.writer(self._file, delimiter=delimiter)
+        self._dict_writer = None
+        if field_names is not None:
+            self._dict_writer = csv.DictWriter(
+                self._file, fieldnames=field_names, delimiter=delimiter
+            )
+        self._error: BaseException | None = None
+        self._counters: dict[str, int] = {"records": 0, "batches": 0}
+        self._start: float = time.monotonic()
+        self._thread = threading.Thread(target=self._write, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "CsvWriterService":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def producer(self) -> "CsvProducer":
+        """Return a producer pushing records onto the queue of this service (e.g. for another process)."""
+        return CsvProducer(self.queue, self._field_names, self._failed)
+
+    def put(self, record: dict | list, timeout: float | None = None) -> None:
+        """Push a record onto the queue, blocking while the queue is full."""
+        self._check([record])
+        self.queue.put([record], timeout=timeout)
+
+    def put_many(
+        self, records: list[dict | list], timeout: float | None = None
+    ) -> None:
+        """Push a list of records onto the queue as a single item, blocking while the queue is full."""
+        if records:
+            records = list(records)
+            self._check(records)
+            self.queue.put(records, timeout=timeout)
+
+    def _check(self, records: list[dict | list]) -> None:
+        """Raise an error if the records cannot be written or the writer thread has stopped."""
+        _check_csv_records(records, self._field_names)
+        if self._error is not None:
+            raise self._error
+        if not self._thread.is_alive():
+            raise RuntimeError("The writer service is closed")
+
+    def stats(self) -> dict[str, float]:
+        """Return the throughput counters: the written `"records"` and `"batches"`, the `"seconds"` since the start and the `"records_per_second"`."""
+        seconds: float = time.monotonic() - self._start
+        return {
+            **self._counters,
+            "seconds": seconds,
+            "records_per_second": (
+                self._counters["records"] / seconds if seconds else 0.0
+            ),
+        }
+
+    def close(self) -> None:
+        """Write the remaining queued records, stop the writer thread and close the CSV file."""
+        if self._thread.is_alive():
+            self.queue.put(None)
+            self._thread.join()
+        if not self._file.closed:
+            self._file.close()
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+        if self._error is not None:
+            raise self._error
+
+    def _write(self) -> None:
+        """Write the queued records in batches until the stop item (`None`) is received."""
+        stop: bool = False
+        try:
+            while not stop:
+                items: list = [self.queue.get()]
+                # Collect the items which are already queued, up to the batch size
+                while len(items) < self.batch_size:
+                    try:
+                        items.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if None in items:
+                    stop = True
+                    items = items[: items.index(None)]
+                for records in items:
+                    self._write_records(records)
+                self._file.flush()
+                self._counters["batches"] += 1
+        except BaseException as e:
+            self._error = e
+            self._failed.set()
+            # Discard the queued records until the stop item, producers would block on a full queue
+            try:
+                while not stop and self.queue.get() is not None:
+                    pass
+            except BaseException:
+                pass
+
+    def _write_records(self, records: list[dict | list]) -> None:
+        for record in records:
+            if isinstance(record, dict):
+                self._dict_writer.writerow(record)
+            else:
+                self._writer.writerow(record)
+        self._counters["records"] += len(records)
+
+
+class CsvProducer:
+    """Push records onto the queue of a `CsvWriterService`, can be passed to other processes.
+
+    Pushing raises a `RuntimeError` once the writer thread of the service has failed, the records would be discarded.
+
+    Args:
+        -   `record_queue` (`multiprocessing.Queue`): The queue of the writer service.
+        -   `field_names` (`list[str] | None`, optional): A list of strings representing the field names of dictionary records, `None` if all records are lists. Defaults to `None`.
+        -   `failed` (`multiprocessing.Event | None`, optional): The event set by the writer service when writing fails, `None` to not check. Defaults to `None`.
+    """
+
+    def __init__(
+        self, record_queue, field_names: list[str] | None = None, failed=None
+    ) -> None:
+        self.queue = record_queue
+        self.field_names: list[str] | None = field_names
+        self.failed = failed
+
+    def put(self, record: dict | list, timeout: float | None = None) -> None:
+        """Push a record onto the queue, blocking while the queue is full."""
+        self._check([record])
+        self.queue.put([record], timeout=timeout)
+
+    def put_many(
+        self, records: list[dict | list], timeout: float | None = None
+    ) -> None:
+        """Push a list of records onto the queue as a single item, blocking while the queue is full."""
+        if records:
+            records = list(records)
+            self._check(records)
+            self.queue.put(records, timeout=timeout)
+
+    def _check(self, records: list[dict | list]) -> None:
+        """Raise an error if the records cannot be written or the writer service has failed."""
+        _check_csv_records(records, self.field_names)
+        if self.failed is not None and self.failed.is_set():
+            raise RuntimeError(
+                "The writer service has failed, the records are discarded"
+            )
+
+
+def _check_csv_records(
+    records: list[dict | list], field_names: list[str] | None
+) -> None:
+    """Raise an error if dictionary records have no field names or fields which are not in the field names."""
+    allowed: set | None = None
+    for record in records:
+        if isinstance(record, dict):
+            if field_names is None:
+                raise TypeError(
+                    "Dictionary records require the field names of the service"
+                )
+            if allowed is None:
+                allowed = set(field_names)
+            if not record.keys() <= allowed:
+                extra: list = [key for key in record if key not in allowed]
+                raise ValueError(f"Fields not in the field names: {extra}")
+
+
 def read_csv_records(
-    file_path: str, field_names: list[str] | None = None, delimiter: str = ";"
+    file_path: str,
+    field_names: list[str] | None = None,
+    delimiter: str = ";",
+    columns: list[str] | None = None,
+    where: Callable[[list], bool] | tuple | list[tuple] | None = None,
+    row_type: str = "dict",
 ) -> list[dict]:
     """Read the records from a CSV file into a list of dictionaries.
 
+    The `columns` and `where` arguments are applied while parsing, fields which are not selected never become dictionary entries and rows which are rejected never become records.
+    The `where` condition is either a callable receiving the (raw) row list, or a simple expression `(field, operator, value)` (or a list of expressions which all have to match).
+    The supported operators are `"=="`, `"!="`, `"<"`, `"<="`, `">"`, `">="`, `"in"` and `"not in"`, the fields are converted to the type of a numeric value before comparing (rows with non-numeric fields are rejected).
+    The `row_type` argument selects a compact record type: `"namedtuple"` and `"slots"` records support both attribute and key access (e.g. `record.ID` and `record["ID"]`), `"tuple"` records are plain tuples of which the first one is the (shared) header.
+
     Args:
         -   `file_path` (`str`): A string representing the source file path.
         -   `field_names` (`list[str] | None`, optional): A list of strings representing the field names. Defaults to `None`.
         -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `columns` (`list[str] | None`, optional): A list of strings representing the field names to include in the records, `None` includes all fields. Defaults to `None`.
+        -   `where` (`Callable[[list], bool] | tuple | list[tuple] | None`, optional): A callable or (list of) expression(s) representing the condition rows have to match (e.g. `("Country", "==", "NL")`). Defaults to `None`.
+        -   `row_type` (`str`, optional): A string representing the type of the records, `"dict"`, `"namedtuple"`, `"slots"` or `"tuple"`. Defaults to `"dict"`.
 
     Returns:
         -   `list[dict]`: A list of dictionaries representing the records from the CSV file.
@@ -111,14 +484,1753 @@ def read_csv_records(
     records: list[dict] = []
     # Open the file from the given path in the read mode
     with open(file_path, "r") as f:
-        # Create a CSV reader
-        reader = csv.DictReader(f, fieldnames=field_names, delimiter=delimiter)
         # Read each record from the CSV file and append it to the records list
-        for record in reader:
+        for record in _read_records(
+            f, field_names, delimiter, columns, where, row_type
+        ):
             records.append(record)
     return records
 
 
+def iter_csv_records(
+    file_path: str,
+    field_names: list[str] | None = None,
+    delimiter: str = ";",
+    encoding: str | None = None,
+    batch_size: int = 0,
+    columns: list[str] | None = None,
+    where: Callable[[list], bool] | tuple | list[tuple] | None = None,
+    row_type: str = "dict",
+) -> Iterator[dict] | Iterator[list[dict]]:
+    """Iterate over the records of a CSV file as dictionaries without loading the whole file into memory.
+
+    The file is only read as far as the records are consumed, stopping the iteration early (e.g. `break`) closes the file without reading the remaining records.
+    See `read_csv_records()` for the column projection (`columns`), the row filter (`where`) and the record types (`row_type`).
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `field_names` (`list[str] | None`, optional): A list of strings representing the field names. Defaults to `None`.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `batch_size` (`int`, optional): An integer representing the number of records per yielded batch, `0` yields the records one at a time. Defaults to `0`.
+        -   `columns` (`list[str] | None`, optional): A list of strings representing the field names to include in the records, `None` includes all fields. Defaults to `None`.
+        -   `where` (`Callable[[list], bool] | tuple | list[tuple] | None`, optional): A callable or (list of) expression(s) representing the condition rows have to match (e.g. `("Country", "==", "NL")`). Defaults to `None`.
+        -   `row_type` (`str`, optional): A string representing the type of the records, `"dict"`, `"namedtuple"`, `"slots"` or `"tuple"`. Defaults to `"dict"`.
+
+    Returns:
+        -   `Iterator[dict] | Iterator[list[dict]]`: An iterator of dictionaries, or of batches (lists of dictionaries) if a batch size is given.
+    """
+    # Open the file from the given path in the read mode
+    with open(file_path, "r", encoding=encoding) as f:
+        records = _read_records(f, field_names, delimiter, columns, where, row_type)
+        # Yield each record (or batch of records) from the CSV file
+        if batch_size > 0:
+            yield from _batched(records, batch_size)
+        else:
+            yield from records
+
+
+def _read_records(
+    f: Iterable[str],
+    field_names: list[str] | None,
+    delimiter: str,
+    columns: list[str] | None,
+    where: Callable[[list], bool] | tuple | list[tuple] | None,
+    row_type: str = "dict",
+) -> Iterator:
+    """Parse the records of an opened CSV file, applying the column projection and the row filter before a record is built."""
+    if columns is None and where is None and row_type == "dict":
+        yield from csv.DictReader(f, fieldnames=field_names, delimiter=delimiter)
+        return
+    reader = csv.reader(f, delimiter=delimiter)
+    if field_names is None:
+        # The first non-empty row contains the field names
+        field_names = next((row for row in reader if row), None)
+        if field_names is None:
+            return
+    positions: dict[str, int] = {name: idx for idx, name in enumerate(field_names)}
+    if columns is None:
+        columns = field_names
+    for name in columns:
+        if name not in positions:
+            raise ValueError(f"Unknown column '{name}'")
+    selected: list[tuple[str, int]] = [(name, positions[name]) for name in columns]
+    indexes: list[int] = [idx for _, idx in selected]
+    make_record: Callable[[list], object] | None = None
+    if row_type != "dict":
+        make_record = _record_factory(columns, row_type)
+        if row_type == "tuple":
+            yield tuple(columns)
+    condition: Callable[[list], bool] | None = _compile_where(where, positions)
+    nr_fields: int = len(field_names)
+    for row in reader:
+        # Skip empty rows and fill missing fields with `None` (like `csv.DictReader`)
+        if not row:
+            continue
+        if len(row) < nr_fields:
+            row += [None] * (nr_fields - len(row))
+        if condition is not None and not condition(row):
+            continue
+        if make_record is None:
+            yield {name: row[idx] for name, idx in selected}
+        else:
+            yield make_record([row[idx] for idx in indexes])
+
+
+def _record_factory(keys: list[str], row_type: str) -> Callable[[list], object]:
+    """Return a callable creating a record of the given type from a list of values (in the order of the keys)."""
+    if row_type == "dict":
+        return lambda values: dict(zip(keys, values))
+    if row_type == "tuple":
+        return tuple
+    if row_type == "namedtuple":
+        return _namedtuple_record(keys)._make
+    if row_type == "slots":
+        return _slots_record(keys)
+    raise ValueError(f"Unknown row type '{row_type}'")
+
+
+def _namedtuple_record(keys: list[str]) -> type:
+    """Create a named tuple record class which also supports key access (e.g. `record["ID"]`)."""
+    base: type = namedtuple("Record", keys, rename=True)
+    index: dict[str, int] = {key: idx for idx, key in enumerate(keys)}
+
+    def __getitem__(self, key: str | int | slice):
+        if isinstance(key, str):
+            key = index[key]
+        return tuple.__getitem__(self, key)
+
+    def _asdict(self) -> dict:
+        return dict(zip(keys, self))
+
+    return type(
+        "Record",
+        (base,),
+        {"__slots__": (), "__getitem__": __getitem__, "_asdict": _asdict},
+    )
+
+
+def _slots_record(keys: list[str]) -> type:
+    """Create a `__slots__` record class which supports attribute and key access (e.g. `record["ID"]`)."""
+    # Use the (renamed) field names of a named tuple as valid attribute names
+    names: tuple[str, ...] = namedtuple("Record", keys, rename=True)._fields
+    attributes: dict[str, str] = dict(zip(keys, names))
+
+    def __init__(self, values: list) -> None:
+        for name, value in zip(names, values):
+            setattr(self, name, value)
+
+    def __getitem__(self, key: str):
+        return getattr(self, attributes[key])
+
+    def __iter__(self) -> Iterator:
+        return (getattr(self, name) for name in names)
+
+    def __len__(self) -> int:
+        return len(names)
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and tuple(self) == tuple(other)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in zip(names, self))
+        return f"Record({fields})"
+
+    def _asdict(self) -> dict:
+        return dict(zip(keys, self))
+
+    return type(
+        "Record",
+        (),
+        {
+            "__slots__": names,
+            "__init__": __init__,
+            "__getitem__": __getitem__,
+            "__iter__": __iter__,
+            "__len__": __len__,
+            "__eq__": __eq__,
+            "__hash__": None,
+            "__repr__": __repr__,
+            "_asdict": _asdict,
+        },
+    )
+
+
+# Comparison function by `where` expression operator
+_WHERE_OPERATORS: dict[str, Callable[[object, object], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda field, values: field in values,
+    "not in": lambda field, values: field not in values,
+}
+
+
+def _compile_where(
+    where: Callable[[list], bool] | tuple | list[tuple] | None,
+    positions: dict[str, int],
+) -> Callable[[list], bool] | None:
+    """Compile a `where` condition into a callable on the (raw) row list."""
+    if where is None or callable(where):
+        return where
+    expressions: list[tuple] = [where] if isinstance(where, tuple) else list(where)
+    conditions: list[Callable[[list], bool]] = []
+    for name, op, value in expressions:
+        if name not in positions:
+            raise ValueError(f"Unknown column '{name}'")
+        if op not in _WHERE_OPERATORS:
+            raise ValueError(f"Unknown operator '{op}'")
+        conditions.append(_compile_expression(positions[name], op, value))
+    if len(conditions) == 1:
+        return conditions[0]
+    return lambda row: all(condition(row) for condition in conditions)
+
+
+def _compile_expression(idx: int, op: str, value: object) -> Callable[[list], bool]:
+    """Compile a single `(field, operator, value)` expression into a callable on the (raw) row list."""
+    compare: Callable[[object, object], bool] = _WHERE_OPERATORS[op]
+    sample = next(iter(value), None) if op in ("in", "not in") else value
+    if not isinstance(sample, (int, float)) or isinstance(sample, bool):
+        return lambda row: compare(row[idx], value)
+    convert: type = type(sample)
+
+    def condition(row: list) -> bool:
+        try:
+            return compare(convert(row[idx]), value)
+        except (TypeError, ValueError):
+            return False
+
+    return condition
+
+
+def read_csv_columns(
+    file_path: str,
+    schema: dict[str, str] | None = None,
+    delimiter: str = ";",
+    encoding: str | None = None,
+    sample_size: int = 1000,
+    use_numpy: bool | None = None,
+) -> dict[str, array | list]:
+    """Read the data from a CSV file (with a header row) into typed, compact columns.
+
+    The column types are taken from the given schema or inferred from the first rows of the file (`sample_size`), the supported types are `"int"`, `"float"`, `"bool"`, `"date"` (ISO format) and `"str"`.
+    Numeric and boolean columns are stored in `array.array` buffers, date columns as `array.array` buffers of day ordinals and string columns as lists of interned strings.
+    If NumPy is used, the non-string columns are returned as NumPy arrays instead (date columns as `datetime64[D]` arrays).
+    Empty values of a float column are stored as `nan`, an integer column containing empty values is inferred as a float column.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `schema` (`dict[str, str] | None`, optional): A dictionary representing the type of (some of) the columns by field name (e.g. `{"ID": "int"}`). Defaults to `None`.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `sample_size` (`int`, optional): An integer representing the number of rows used to infer the column types. Defaults to `1000`.
+        -   `use_numpy` (`bool | None`, optional): A boolean, `True` to return NumPy arrays for the non-string columns, `None` to use NumPy only if it is installed. Defaults to `None`.
+
+    Returns:
+        -   `dict[str, array | list]`: A dictionary containing the columns of the CSV file by field name.
+    """
+    if schema is None:
+        schema = {}
+    rows: Iterator[list] = iter_csv(file_path, delimiter, encoding)
+    header: list[str] = next(rows, [])
+    # Infer the column types from the first rows
+    sample: list[tuple] = _to_columns(list(islice(rows, sample_size)), len(header))
+    types: list[str] = [
+        schema.get(name) or _infer_column_type(values)
+        for name, values in zip(header, sample)
+    ]
+    columns: list[array | list] = []
+    for column_type in types:
+        typecode: str = _COLUMN_TYPES[column_type][1]
+        columns.append(array(typecode) if typecode else [])
+    # Convert the sample and the remaining rows, a batch of columns at a time
+    batches: Iterator[list[tuple]] = (
+        _to_columns(batch, len(header)) for batch in _batched(rows, 10000)
+    )
+    for batch in chain([sample], batches):
+        for idx, values in enumerate(batch):
+            try:
+                columns[idx].extend(map(_COLUMN_TYPES[types[idx]][0], values))
+            except ValueError as e:
+                raise ValueError(
+                    f"Column '{header[idx]}' does not match the type '{types[idx]}': {e}"
+                ) from e
+    # Convert the buffers into NumPy arrays
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        for idx, column_type in enumerate(types):
+            if column_type != "str":
+                columns[idx] = _to_numpy(columns[idx], column_type)
+    return dict(zip(header, columns))
+
+
+def _to_columns(rows: list[list], nr_columns: int) -> list[tuple]:
+    """Transpose a batch of rows into columns, skipping blank lines and padding short rows with empty values."""
+    rows = [
+        row if len(row) == nr_columns else (row + [""] * nr_columns)[:nr_columns]
+        for row in rows
+        if row
+    ]
+    if not rows:
+        return [() for _ in range(nr_columns)]
+    return list(zip(*rows))
+
+
+def _to_float(value: str) -> float:
+    return float(value) if value != "" else float("nan")
+
+
+def _to_bool(value: str) -> bool:
+    value = value.strip().lower()
+    if value in ("true", "1", "yes"):
+        return True
+    if value in ("false", "0", "no", ""):
+        return False
+    raise ValueError(f"invalid boolean value: '{value}'")
+
+
+def _to_date(value: str) -> int:
+    return date.fromisoformat(value).toordinal()
+
+
+def _to_numpy(column: array, column_type: str):
+    """Convert an array buffer into a NumPy array without copying the data (except for dates)."""
+    values = np.frombuffer(column, dtype=column.typecode)
+    if column_type == "bool":
+        return values.astype(bool)
+    if column_type == "date":
+        # Day ordinals into days since the epoch (1970-01-01)
+        return (values - date(1970, 1, 1).toordinal()).astype("datetime64[D]")
+    return values
+
+
+# Converter and `array` typecode by column type
+_COLUMN_TYPES: dict[str, tuple[Callable, str]] = {
+    "int": (int, "q"),
+    "float": (_to_float, "d"),
+    "bool": (_to_bool, "b"),
+    "date": (_to_date, "q"),
+    "str": (sys.intern, ""),
+}
+
+
+def _infer_column_type(values: tuple) -> str:
+    """Infer the type of a column from a sample of its values."""
+    filled: list[str] = [value for value in values if value != ""]
+    if not filled:
+        return "str"
+    for column_type in ("int", "float", "bool", "date"):
+        try:
+            for value in filled:
+                _COLUMN_TYPES[column_type][0](value)
+        except ValueError:
+            continue
+        if column_type == "int" and len(filled) < len(values):
+            return "float"
+        if column_type != "float" and len(filled) < len(values):
+            continue
+        return column_type
+    return "str"
+
+
+def read_csv_parallel(
+    file_path: str,
+    delimiter: str = ";",
+    encoding: str | None = None,
+    workers: int | None = None,
+    chunk_size: int = 16 * 1024 * 1024,
+) -> list[list]:
+    """Read the data from a CSV file into a matrix, parsing chunks of the file in parallel worker processes. A matrix is a list of lists (2D-array).
+
+    The result is equal to the result of `read_csv()`, see `iter_csv_parallel()` for the chunking of the file.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `workers` (`int | None`, optional): An integer representing the number of worker processes, `None` uses the number of CPUs. Defaults to `None`.
+        -   `chunk_size` (`int`, optional): An integer representing the approximate size (in bytes) of a chunk parsed by a worker. Defaults to `16777216` (16 MiB).
+
+    Returns:
+        -   `list[list]`: A matrix data structure, a list of list (2D-array).
+    """
+    matrix: list[list] = []
+    for chunk in iter_csv_parallel(file_path, delimiter, encoding, workers, chunk_size):
+        matrix.extend(chunk)
+    return matrix
+
+
+def iter_csv_parallel(
+    file_path: str,
+    delimiter: str = ";",
+    encoding: str | None = None,
+    workers: int | None = None,
+    chunk_size: int = 16 * 1024 * 1024,
+    ordered: bool = True,
+) -> Iterator[list[list]]:
+    """Iterate over the parsed chunks (matrices) of a CSV file, parsing the chunks in parallel worker processes.
+
+    The file is split at record boundaries (quoted fields containing newlines are kept together), the number of chunks in progress is bounded to twice the number of workers.
+    The encoding of the file has to be ASCII compatible (e.g. UTF-8 or Latin-1), the header row (if any) is the first row of the first chunk.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `workers` (`int | None`, optional): An integer representing the number of worker processes, `None` uses the number of CPUs. Defaults to `None`.
+        -   `chunk_size` (`int`, optional): An integer representing the approximate size (in bytes) of a chunk parsed by a worker. Defaults to `16777216` (16 MiB).
+        -   `ordered` (`bool`, optional): A boolean, `True` to yield the chunks in the original order of the file, `False` to yield the chunks as soon as they are parsed. Defaults to `True`.
+
+    Returns:
+        -   `Iterator[list[list]]`: An iterator of matrices, the parsed chunks of the CSV file.
+    """
+    workers = workers or os.cpu_count() or 1
+    separator: bytes = delimiter.encode(encoding or locale.getpreferredencoding(False))
+    offsets: list[int] = _csv_chunk_offsets(file_path, chunk_size, separator)
+    chunks: Iterator[tuple[int, int]] = zip(offsets, offsets[1:])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: list[Future] = []
+        for start, stop in chunks:
+            pending.append(
+                executor.submit(
+                    _read_csv_chunk, file_path, start, stop, delimiter, encoding
+                )
+            )
+            # Wait for a chunk if the maximum number of chunks are in progress
+            while len(pending) >= workers * 2:
+                yield from _collect_futures(pending, ordered)
+        while pending:
+            yield from _collect_futures(pending, ordered)
+
+
+def benchmark_csv_parallel(
+    file_path: str,
+    delimiter: str = ";",
+    encoding: str | None = None,
+    workers: list[int] | None = None,
+    chunk_size: int = 16 * 1024 * 1024,
+) -> dict[int, dict[str, float]]:
+    """Measure the speedup of `read_csv_parallel()` against `read_csv()` for the given numbers of worker processes.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `workers` (`list[int] | None`, optional): A list of integers representing the numbers of worker processes to measure, `None` measures powers of two up to the number of CPUs. Defaults to `None`.
+        -   `chunk_size` (`int`, optional): An integer representing the approximate size (in bytes) of a chunk parsed by a worker. Defaults to `16777216` (16 MiB).
+
+    Returns:
+        -   `dict[int, dict[str, float]]`: A dictionary containing the duration (`"seconds"`) and the `"speedup"` by number of workers, `0` workers represents the serial `read_csv()`.
+    """
+    if workers is None:
+        workers = [2**i for i in range((os.cpu_count() or 1).bit_length())]
+    results: dict[int, dict[str, float]] = {}
+    start: float = time.perf_counter()
+    read_csv(file_path, delimiter, encoding=encoding)
+    serial: float = time.perf_counter() - start
+    results[0] = {"seconds": serial, "speedup": 1.0}
+    for nr_workers in workers:
+        start = time.perf_counter()
+        read_csv_parallel(file_path, delimiter, encoding, nr_workers, chunk_size)
+        duration: float = time.perf_counter() - start
+        results[nr_workers] = {"seconds": duration, "speedup": serial / duration}
+    return results
+
+
+def iter_csv_mmap(
+    file_path: str, delimiter: str = ";", encoding: str | None = None
+) -> Iterator["CsvRowView"]:
+    """Iterate over the rows of a memory-mapped CSV file, without decoding the file.
+
+    The rows are split directly on the mapped bytes and returned as `CsvRowView` sequences, which only decode the fields that are accessed.
+    The mapped pages are shared (through the page cache) with other processes mapping the same file.
+    The encoding of the file has to be ASCII compatible (e.g. UTF-8 or Latin-1) and the row views can only be accessed during the iteration.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+
+    Returns:
+        -   `Iterator[CsvRowView]`: An iterator of row views.
+    """
+    encoding = encoding or locale.getpreferredencoding(False)
+    separator: bytes = delimiter.encode(encoding)
+    record, _ = _csv_record_patterns(separator)
+    with open(file_path, "rb") as f:
+        # An empty file can not be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            start: int = 0
+            size: int = len(buffer)
+            while start < size:
+                end: int = _find_record_end(buffer, start, size, record)
+                yield CsvRowView(buffer, start, end, separator, encoding)
+                start = end + 1
+
+
+class CsvRowView(Sequence):
+    """A read-only sequence of the fields of a CSV row, on top of the (memory-mapped) bytes of the row.
+
+    The field boundaries are determined on first access and a field is only decoded when it is accessed (e.g. `row[2]`), `list(row)` decodes all fields.
+    Quoted fields are unquoted (`""` within a quoted field is an escaped quote), trailing carriage returns are ignored.
+    """
+
+    __slots__ = ("_buffer", "_start", "_end", "_separator", "_encoding", "_bounds")
+
+    def __init__(
+        self,
+        buffer: mmap.mmap | bytes,
+        start: int,
+        end: int,
+        separator: bytes,
+        encoding: str,
+    ) -> None:
+        if end > start and buffer[end - 1 : end] == b"\r":
+            end -= 1
+        self._buffer = buffer
+        self._start: int = start
+        self._end: int = end
+        self._separator: bytes = separator
+        self._encoding: str = encoding
+        self._bounds: list[tuple[int, int]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._field_bounds())
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        bounds = self._field_bounds()[index]
+        if isinstance(index, slice):
+            return [self._decode(start, end) for start, end in bounds]
+        return self._decode(*bounds)
+
+    def __repr__(self) -> str:
+        return f"CsvRowView({list(self)!r})"
+
+    def _field_bounds(self) -> list[tuple[int, int]]:
+        """Return the (start, end) offsets of the fields, splitting the row on the separators outside of quoted fields."""
+        if self._bounds is not None:
+            return self._bounds
+        buffer, separator = self._buffer, self._separator
+        start, end = self._start, self._end
+        bounds: list[tuple[int, int]] = []
+        if start == end:
+            self._bounds = bounds
+            return bounds
+        while True:
+            # Skip separators within a quoted field
+            position: int = start
+            if buffer[start : start + 1] == b'"':
+                position = start + 1
+                while True:
+                    quote: int = buffer.find(b'"', position, end)
+                    if quote == -1:
+                        position = end
+                        break
+                    position = quote + 1
+                    if buffer[position : position + 1] != b'"':
+                        break
+                    position += 1
+            stop: int = buffer.find(separator, position, end)
+            if stop == -1:
+                bounds.append((start, end))
+                break
+            bounds.append((start, stop))
+            start = stop + len(separator)
+        self._bounds = bounds
+        return bounds
+
+    def _decode(self, start: int, end: int) -> str:
+        value: str = self._buffer[start:end].decode(self._encoding)
+        if not value.startswith('"'):
+            return value
+        # Unquote the quoted part, the rest of the field (after the closing quote) is literal
+        quote: int = value.find('"', 1)
+        while quote != -1 and value[quote + 1 : quote + 2] == '"':
+            quote = value.find('"', quote + 2)
+        if quote == -1:
+            return value[1:].replace('""', '"')
+        return value[1:quote].replace('""', '"') + value[quote + 1 :]
+
+
+def _find_record_end(
+    buffer: mmap.mmap | bytes, start: int, size: int, record: re.Pattern
+) -> int:
+    """Return the offset of the newline ending the record starting at the given offset (see `_csv_record_patterns()`)."""
+    match = record.match(buffer, start)
+    return match.end() - 1 if match else size
+
+
+def build_csv_index(
+    file_path: str,
+    index_path: str | None = None,
+    delimiter: str = ";",
+    encoding: str | None = None,
+) -> array:
+    """Build the row index of a CSV file and save it next to the file.
+
+    The row index contains the byte offset of the start of each row (record) followed by the size of the file, quoted fields containing newlines are kept within a single row.
+    The index file also contains the size and modification time of the CSV file, to detect if the index is outdated.
+    The encoding of the file has to be ASCII compatible (e.g. UTF-8 or Latin-1).
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `index_path` (`str | None`, optional): A string representing the index file path, `None` uses the source file path with the extension `".idx"` appended. Defaults to `None`.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+
+    Returns:
+        -   `array`: An array of unsigned integers (`"Q"`) containing the byte offsets of the rows.
+    """
+    separator: bytes = delimiter.encode(encoding or locale.getpreferredencoding(False))
+    record, _ = _csv_record_patterns(separator)
+    offsets = array("Q")
+    # The data read since the last record boundary (at the offset `position`)
+    data: bytes = b""
+    position: int = 0
+    stat: os.stat_result = os.stat(file_path)
+    with open(file_path, "rb") as f:
+        for block in iter(partial(f.read, 1024 * 1024), b""):
+            data += block
+            end: int = 0
+            while match := record.match(data, end):
+                offsets.append(position + end)
+                end = match.end()
+            data = data[end:]
+            position += end
+    # The last row without a newline
+    if data:
+        offsets.append(position)
+    offsets.append(position + len(data))
+    # Save the index, preceded by the size and modification time of the file
+    with open(index_path or file_path + ".idx", "wb") as f:
+        array("Q", [stat.st_size, stat.st_mtime_ns]).tofile(f)
+        offsets.tofile(f)
+    return offsets
+
+
+def load_csv_index(
+    file_path: str,
+    index_path: str | None = None,
+    delimiter: str = ";",
+    encoding: str | None = None,
+) -> array:
+    """Load the row index of a CSV file, the index is (re)built if it does not exist or if it is outdated.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `index_path` (`str | None`, optional): A string representing the index file path, `None` uses the source file path with the extension `".idx"` appended. Defaults to `None`.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+
+    Returns:
+        -   `array`: An array of unsigned integers (`"Q"`) containing the byte offsets of the rows, followed by the size of the file.
+    """
+    index_path = index_path or file_path + ".idx"
+    stat: os.stat_result = os.stat(file_path)
+    if os.path.exists(index_path):
+        offsets = array("Q")
+        with open(index_path, "rb") as f:
+            offsets.fromfile(f, os.path.getsize(index_path) // offsets.itemsize)
+        # Use the index if the file did not change since the index is built
+        if offsets[:2] == array("Q", [stat.st_size, stat.st_mtime_ns]):
+            return offsets[2:]
+    return build_csv_index(file_path, index_path, delimiter, encoding)
+
+
+def count_csv_rows(
+    file_path: str,
+    index_path: str | None = None,
+    delimiter: str = ";",
+    encoding: str | None = None,
+) -> int:
+    """Return the number of rows of a CSV file (including the header row) using the row index.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `index_path` (`str | None`, optional): A string representing the index file path, `None` uses the source file path with the extension `".idx"` appended. Defaults to `None`.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+
+    Returns:
+        -   `int`: An integer representing the number of rows.
+    """
+    return len(load_csv_index(file_path, index_path, delimiter, encoding)) - 1
+
+
+def read_csv_rows(
+    file_path: str,
+    start: int,
+    stop: int | None = None,
+    delimiter: str = ";",
+    encoding: str | None = None,
+    index_path: str | None = None,
+) -> list[list]:
+    """Read a slice of rows from a CSV file into a matrix, seeking directly to the rows using the row index. A matrix is a list of lists (2D-array).
+
+    The rows are numbered like the rows of the matrix returned by `read_csv()` (the header row is row `0`), negative numbers count from the end.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `start` (`int`): An integer representing the number of the first row.
+        -   `stop` (`int | None`, optional): An integer representing the number of the row to stop before, `None` reads the rows up to the end of the file. Defaults to `None`.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `index_path` (`str | None`, optional): A string representing the index file path, `None` uses the source file path with the extension `".idx"` appended. Defaults to `None`.
+
+    Returns:
+        -   `list[list]`: A matrix data structure, a list of list (2D-array).
+    """
+    offsets: array = load_csv_index(file_path, index_path, delimiter, encoding)
+    start, stop, _ = slice(start, stop).indices(len(offsets) - 1)
+    if start >= stop:
+        return []
+    return _read_csv_chunk(
+        file_path, offsets[start], offsets[stop], delimiter, encoding
+    )
+
+
+def follow_csv(
+    file_path: str,
+    checkpoint_path: str | None = None,
+    delimiter: str = ";",
+    encoding: str | None = None,
+    timeout: float | None = 0,
+    poll_interval: float = 1.0,
+) -> Iterator[dict]:
+    """Iterate over the records appended to a (growing) CSV file since the last checkpoint.
+
+    The byte offset of the next record, the field names and the identity of the file (device, inode and a hash of the first bytes) are saved in a small JSON checkpoint file, which is updated each time the records of a read are consumed.
+    An incomplete last row (still being written) is left for the next read, a truncated or replaced (rotated) file is read again from the start.
+    A missing file (e.g. renamed before it is recreated) is polled like a file without new records.
+    Records which are yielded but not consumed before the iteration is stopped are yielded again on the next run.
+    The encoding of the file has to be ASCII compatible (e.g. UTF-8 or Latin-1).
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `checkpoint_path` (`str | None`, optional): A string representing the checkpoint file path, `None` keeps the checkpoint in memory only. Defaults to `None`.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `timeout` (`float | None`, optional): A float representing the number of seconds to keep polling for new records after the last new records, `0` only reads the records available now and `None` follows the file forever. Defaults to `0`.
+        -   `poll_interval` (`float`, optional): A float representing the number of seconds between the polls of the file. Defaults to `1.0`.
+
+    Returns:
+        -   `Iterator[dict]`: An iterator of dictionaries representing the new records of the CSV file.
+    """
+    checkpoint: dict = {"offset": 0, "field_names": None, "file_id": None}
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        with open(checkpoint_path, "r") as f:
+            checkpoint = json.load(f)
+    separator: bytes = delimiter.encode(encoding or locale.getpreferredencoding(False))
+    _, records = _csv_record_patterns(separator)
+    last_data: float = time.monotonic()
+    read_size: int = 16 * 1024 * 1024
+    while True:
+        available: int = 0
+        data: bytes = b""
+        try:
+            with open(file_path, "rb") as f:
+                stat: os.stat_result = os.fstat(f.fileno())
+                file_id: list[int] = [stat.st_dev, stat.st_ino]
+                head: bytes = f.read(4096)
+                fingerprint: str = _file_fingerprint(head, checkpoint["offset"])
+                # Checkpoints without a fingerprint (of an earlier version) identify the file by the inode only
+                checkpoint.setdefault("fingerprint", fingerprint)
+                # Read the file from the start if it is truncated or replaced (a new file may reuse the inode)
+                if (
+                    checkpoint["file_id"] != file_id
+                    or stat.st_size < checkpoint["offset"]
+                    or checkpoint["fingerprint"] != fingerprint
+                ):
+                    checkpoint = {
+                        "offset": 0,
+                        "field_names": None,
+                        "file_id": file_id,
+                        "fingerprint": _file_fingerprint(head, 0),
+                    }
+                # Read (a block of) the data appended since the checkpoint
+                available = stat.st_size - checkpoint["offset"]
+                if available > 0:
+                    f.seek(checkpoint["offset"])
+                    data = f.read(min(available, read_size))
+        except FileNotFoundError:
+            # The file is missing while it is rotated (renamed before it is recreated)
+            pass
+        # Only parse the complete rows (ending with a newline outside of quoted fields)
+        end: int = records.match(data).end()
+        if end > 0:
+            with io.TextIOWrapper(io.BytesIO(data[:end]), encoding=encoding) as text:
+                reader = csv.DictReader(
+                    text, fieldnames=checkpoint["field_names"], delimiter=delimiter
+                )
+                yield from reader
+                checkpoint["field_names"] = reader.fieldnames
+            checkpoint["offset"] += end
+            checkpoint["fingerprint"] = _file_fingerprint(head, checkpoint["offset"])
+            if checkpoint_path:
+                _write_checkpoint(checkpoint, checkpoint_path)
+            last_data = time.monotonic()
+        elif len(data) < available:
+            # The block does not contain a complete row, read a larger block
+            read_size *= 2
+        elif timeout is not None and time.monotonic() - last_data >= timeout:
+            return
+        else:
+            time.sleep(poll_interval)
+
+
+def _file_fingerprint(head: bytes, offset: int) -> str:
+    """Return a hash of the first bytes of a file (the head, up to 4 KiB) before the given offset, to identify the file."""
+    return hashlib.blake2b(head[:offset], digest_size=16).hexdigest()
+
+
+def _write_checkpoint(checkpoint: dict, checkpoint_path: str) -> None:
+    """Write a checkpoint file, replacing the previous checkpoint at once."""
+    with open(checkpoint_path + ".tmp", "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(checkpoint_path + ".tmp", checkpoint_path)
+
+
+def read_csv_cached(
+    file_path: str,
+    delimiter: str = ";",
+    encoding: str | None = None,
+    columnar: bool = False,
+    cache_dir: str | None = None,
+    max_cache_size: int = 1024 * 1024 * 1024,
+) -> list[list] | dict[str, array | list]:
+    """Read the data from a CSV file into a matrix (or columns), using an on-disk cache of the parsed data. A matrix is a list of lists (2D-array).
+
+    The parsed data is cached in a binary file (pickle protocol 5, with the column buffers stored out-of-band) per file path, delimiter, encoding and format.
+    A cached entry is outdated (and replaced) if the size or the modification time of the CSV file changed, the least recently used entries are removed if the total size of the cache exceeds the maximum size.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `columnar` (`bool`, optional): A boolean, `True` to read the data into typed columns (see `read_csv_columns()`) instead of a matrix. Defaults to `False`.
+        -   `cache_dir` (`str | None`, optional): A string representing the cache directory, `None` uses a directory in the temporary directory of the system. Defaults to `None`.
+        -   `max_cache_size` (`int`, optional): An integer representing the maximum total size (in bytes) of the cache directory. Defaults to `1073741824` (1 GiB).
+
+    Returns:
+        -   `list[list] | dict[str, array | list]`: A matrix data structure, a list of list (2D-array), or a dictionary containing the columns by field name.
+    """
+    cache_dir = cache_dir or os.path.join(tempfile.gettempdir(), "csv_functions_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    key: str = repr((os.path.abspath(file_path), delimiter, encoding, columnar))
+    cache_path: str = os.path.join(
+        cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".pkl"
+    )
+    stat: os.stat_result = os.stat(file_path)
+    data = _load_cache(cache_path, stat)
+    if data is not None:
+        # Mark the entry as recently used
+        try:
+            os.utime(cache_path)
+        except FileNotFoundError:
+            # Removed by another process in the meantime
+            pass
+        return data
+    if columnar:
+        data = read_csv_columns(file_path, delimiter=delimiter, encoding=encoding)
+    else:
+        data = read_csv(file_path, delimiter, encoding=encoding)
+    _save_cache(data, cache_path, stat)
+    _evict_cache(cache_dir, max_cache_size)
+    return data
+
+
+def _save_cache(data: object, cache_path: str, stat: os.stat_result) -> None:
+    """Save the data into a cache file: the size and modification time of the source file, the pickled data and the out-of-band buffers."""
+    if isinstance(data, dict):
+        # Pickle the array buffers out-of-band
+        data = {
+            name: (
+                (column.typecode, pickle.PickleBuffer(column))
+                if isinstance(column, array)
+                else column
+            )
+            for name, column in data.items()
+        }
+    buffers: list[pickle.PickleBuffer] = []
+    payload: bytes = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+    # A unique temporary file per process, concurrent processes may save the same entry
+    fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(cache_path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            array("Q", [stat.st_size, stat.st_mtime_ns, len(payload)]).tofile(f)
+            f.write(payload)
+            for buffer in buffers:
+                raw: memoryview = buffer.raw()
+                f.write(raw.nbytes.to_bytes(8, "little"))
+                f.write(raw)
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def _load_cache(cache_path: str, stat: os.stat_result) -> object | None:
+    """Load the data from a cache file, `None` if the cache file does not exist, is outdated or is corrupt (truncated)."""
+    try:
+        with open(cache_path, "rb") as f:
+            header = array("Q")
+            header.fromfile(f, 3)
+            if header[:2] != array("Q", [stat.st_size, stat.st_mtime_ns]):
+                return None
+            payload: bytes = f.read(header[2])
+            buffers: list[bytearray] = []
+            while size := f.read(8):
+                buffer = bytearray(int.from_bytes(size, "little"))
+                if f.readinto(buffer) != len(buffer):
+                    return None
+                buffers.append(buffer)
+        data = pickle.loads(payload, buffers=buffers)
+    except Exception:
+        # A missing or corrupt (e.g. truncated) cache file is a cache miss, the entry is rebuilt
+        return None
+    if isinstance(data, dict):
+        for name, column in data.items():
+            if isinstance(column, tuple):
+                data[name] = array(column[0], column[1])
+    return data
+
+
+def _evict_cache(cache_dir: str, max_cache_size: int) -> None:
+    """Remove the least recently used cache files until the total size is within the maximum size."""
+    entries: list[os.DirEntry] = [
+        entry for entry in os.scandir(cache_dir) if entry.name.endswith(".pkl")
+    ]
+    entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+    total_size: int = sum(entry.stat().st_size for entry in entries)
+    for entry in entries[:-1]:
+        if total_size <= max_cache_size:
+            break
+        total_size -= entry.stat().st_size
+        os.remove(entry.path)
+
+
+def sort_csv(
+    file_path: str,
+    dest_path: str,
+    key_fields: list[str],
+    key_types: list[str] | None = None,
+    reverse: bool = False,
+    delimiter: str = ";",
+    encoding: str | None = None,
+    run_size: int = 500000,
+    workers: int = 1,
+    temp_dir: str | None = None,
+) -> str:
+    """Sort a CSV file (with a header row) by one or more fields into a new CSV file, without loading the whole file into memory (external merge sort).
+
+    The rows are sorted in runs of at most `run_size` rows, which are written to temporary files and merged into the destination file (using `write_csv()`).
+    The key fields are compared as strings, unless a key type (`"int"`, `"float"`, `"bool"`, `"date"` or `"str"`) is given per key field. Blank lines are skipped.
+    Empty key values are sorted before all other values (after them if `reverse`), whatever the key type.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `dest_path` (`str`): A string representing the destination file path.
+        -   `key_fields` (`list[str]`): A list of strings representing the field names to sort by.
+        -   `key_types` (`list[str] | None`, optional): A list of strings representing the type of each key field, `None` compares all key fields as strings. Defaults to `None`.
+        -   `reverse` (`bool`, optional): A boolean, `True` to sort in descending order. Defaults to `False`.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV files. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the source, temporary and destination files. Defaults to `None`.
+        -   `run_size` (`int`, optional): An integer representing the maximum number of rows sorted in memory at once. Defaults to `500000`.
+        -   `workers` (`int`, optional): An integer representing the number of worker processes sorting the runs, `1` sorts the runs in the current process. Defaults to `1`.
+        -   `temp_dir` (`str | None`, optional): A string representing the directory of the temporary run files, `None` uses the temporary directory of the system. Defaults to `None`.
+
+    Returns:
+        -   `str`: A string representing the destination file path.
+    """
+    rows: Iterator[list] = filter(None, iter_csv(file_path, delimiter, encoding))
+    header: list[str] = next(rows, [])
+    indexes: list[int] = [header.index(field) for field in key_fields]
+    converters: list[Callable] = [
+        _COLUMN_TYPES[key_type][0] for key_type in key_types or ["str"] * len(indexes)
+    ]
+    key: Callable[[list], tuple] = partial(_sort_key, indexes, converters)
+    with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+        run_paths: list[str] = []
+        # Sort the runs and write them to temporary files
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending: list[Future] = []
+                for batch in _batched(rows, run_size):
+                    run_paths.append(os.path.join(run_dir, f"{len(run_paths)}.csv"))
+                    pending.append(
+                        executor.submit(
+                            _sort_run,
+                            batch,
+                            key,
+                            reverse,
+                            run_paths[-1],
+                            delimiter,
+                            encoding,
+                        )
+                    )
+                    while len(pending) >= workers:
+                        pending.pop(0).result()
+                for future in pending:
+                    future.result()
+        else:
+            for batch in _batched(rows, run_size):
+                run_paths.append(os.path.join(run_dir, f"{len(run_paths)}.csv"))
+                _sort_run(batch, key, reverse, run_paths[-1], delimiter, encoding)
+        # Merge the sorted runs into the destination file
+        runs: list[Iterator[list]] = [
+            iter_csv(run_path, delimiter, encoding) for run_path in run_paths
+        ]
+        merged: Iterator[list] = heapq.merge(*runs, key=key, reverse=reverse)
+        write_csv(chain([header], merged), dest_path, delimiter, encoding=encoding)
+    return dest_path
+
+
+def _sort_key(indexes: list[int], converters: list[Callable], row: list) -> tuple:
+    """Return the (typed) sort key of a row, empty values get a key before all other values."""
+    return tuple(
+        (1, convert(row[idx])) if row[idx] != "" else (0,)
+        for idx, convert in zip(indexes, converters)
+    )
+
+
+def _sort_run(
+    rows: list[list],
+    key: Callable,
+    reverse: bool,
+    run_path: str,
+    delimiter: str,
+    encoding: str | None,
+) -> str:
+    """Sort a run of rows and write it to a (temporary) CSV file."""
+    rows.sort(key=key, reverse=reverse)
+    # Without newline="" the line ends would be translated (into "\r\r\n" on Windows)
+    with open(run_path, "w", encoding=encoding, newline="") as f:
+        csv.writer(f, delimiter=delimiter).writerows(rows)
+    return run_path
+
+
+def join_csv(
+    left_path: str,
+    right_path: str,
+    on: list[str],
+    how: str = "inner",
+    delimiter: str = ";",
+    encoding: str | None = None,
+    max_memory: int = 256 * 1024 * 1024,
+    temp_dir: str | None = None,
+) -> Iterator[dict]:
+    """Join the records of two CSV files (with header rows) on the given fields, in a single pass over both files (hash join).
+
+    A hash table is built from the records of one file (the smaller file for an `"inner"` join, the right file otherwise), the records of the other file are streamed and matched against it.
+    If the build file is larger than the memory budget, both files are first partitioned on the join fields into temporary files, which are joined partition by partition.
+    The joined records contain the fields of the left record followed by the fields of the right record, right fields with the same name as a left field (except the join fields) get the suffix `"_right"`.
+    The supported joins are `"inner"`, `"left"` (unmatched left records get `None` right fields) and `"anti"` (only the unmatched left records).
+
+    Args:
+        -   `left_path` (`str`): A string representing the left source file path.
+        -   `right_path` (`str`): A string representing the right source file path.
+        -   `on` (`list[str]`): A list of strings representing the field names to join on.
+        -   `how` (`str`, optional): A string representing the type of join, `"inner"`, `"left"` or `"anti"`. Defaults to `"inner"`.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV files. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the files. Defaults to `None`.
+        -   `max_memory` (`int`, optional): An integer representing the maximum size (in bytes) of the build file joined in memory. Defaults to `268435456` (256 MiB).
+        -   `temp_dir` (`str | None`, optional): A string representing the directory of the temporary partition files, `None` uses the temporary directory of the system. Defaults to `None`.
+
+    Returns:
+        -   `Iterator[dict]`: An iterator of dictionaries representing the joined records.
+    """
+    if how not in ("inner", "left", "anti"):
+        raise ValueError(f"Unknown join '{how}'")
+    build_path, probe_path, build_left = right_path, left_path, False
+    if how == "inner" and os.path.getsize(left_path) < os.path.getsize(right_path):
+        build_path, probe_path, build_left = left_path, right_path, True
+    build_fields: list[str] = next(iter_csv(build_path, delimiter, encoding), [])
+    build_size: int = os.path.getsize(build_path)
+    if build_size <= max_memory:
+        yield from _hash_join(
+            iter_csv_records(probe_path, delimiter=delimiter, encoding=encoding),
+            iter_csv_records(build_path, delimiter=delimiter, encoding=encoding),
+            on,
+            how,
+            build_left,
+            build_fields,
+        )
+        return
+    # Partition both files, records with the same key end up in the same partition
+    nr_partitions: int = math.ceil(build_size / max_memory) * 2
+    with tempfile.TemporaryDirectory(dir=temp_dir) as partition_dir:
+        probe_paths: list[str] = _partition_csv(
+            probe_path, on, nr_partitions, partition_dir, delimiter, encoding
+        )
+        build_paths: list[str] = _partition_csv(
+            build_path, on, nr_partitions, partition_dir, delimiter, encoding
+        )
+        for probe_partition, build_partition in zip(probe_paths, build_paths):
+            yield from _hash_join(
+                iter_csv_records(
+                    probe_partition, delimiter=delimiter, encoding=encoding
+                ),
+                iter_csv_records(
+                    build_partition, delimiter=delimiter, encoding=encoding
+                ),
+                on,
+                how,
+                build_left,
+                build_fields,
+            )
+
+
+def group_by_csv(
+    file_path: str,
+    by: list[str],
+    aggregates: dict[str, list[str]],
+    delimiter: str = ";",
+    encoding: str | None = None,
+) -> list[dict]:
+    """Group the records of a CSV file (with a header row) by the given fields and aggregate the values of other fields, in a single pass over the file.
+
+    The supported aggregates are `"count"`, `"sum"`, `"min"`, `"max"` and `"mean"`, empty values are ignored.
+    The values are only converted into floats for the `"sum"`, `"min"`, `"max"` and `"mean"` aggregates, so non-numeric fields can be counted.
+    The result contains a record per group with the group fields and a field per aggregate, named `"<field>_<aggregate>"` (e.g. `"Amount_sum"`).
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `by` (`list[str]`): A list of strings representing the field names to group by.
+        -   `aggregates` (`dict[str, list[str]]`): A dictionary representing the aggregates per field name (e.g. `{"Amount": ["sum", "mean"]}`).
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+
+    Returns:
+        -   `list[dict]`: A list of dictionaries representing the aggregated groups.
+    """
+    for field, names in aggregates.items():
+        for name in names:
+            if name not in ("count", "sum", "min", "max", "mean"):
+                raise ValueError(f"Unknown aggregate '{name}' for field '{field}'")
+    fields: list[str] = list(aggregates)
+    numeric: list[bool] = [
+        any(name != "count" for name in aggregates[field]) for field in fields
+    ]
+    groups: dict[tuple, list[_Accumulator]] = {}
+    for row in iter_csv_records(
+        file_path, delimiter=delimiter, encoding=encoding, columns=by + fields
+    ):
+        key: tuple = tuple(row[field] for field in by)
+        accumulators: list[_Accumulator] | None = groups.get(key)
+        if accumulators is None:
+            accumulators = groups[key] = [_Accumulator(flag) for flag in numeric]
+        for accumulator, field in zip(accumulators, fields):
+            accumulator.add(row[field])
+    records: list[dict] = []
+    for key, accumulators in groups.items():
+        record: dict = dict(zip(by, key))
+        for accumulator, field in zip(accumulators, fields):
+            for name in aggregates[field]:
+                record[f"{field}_{name}"] = accumulator.result(name)
+        records.append(record)
+    return records
+
+
+class _Accumulator:
+    """Accumulate the count and (if numeric) the sum, minimum and maximum of the values of a group."""
+
+    __slots__ = ("numeric", "count", "sum", "min", "max")
+
+    def __init__(self, numeric: bool = True) -> None:
+        self.numeric: bool = numeric
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def add(self, value: str | None) -> None:
+        if value is None or value == "":
+            return
+        self.count += 1
+        if not self.numeric:
+            return
+        number: float = float(value)
+        self.sum += number
+        if self.min is None or number < self.min:
+            self.min = number
+        if self.max is None or number > self.max:
+            self.max = number
+
+    def result(self, name: str) -> float | int | None:
+        if name == "mean":
+            return self.sum / self.count if self.count else None
+        return getattr(self, name)
+
+
+def profile_csv(
+    file_path: str,
+    delimiter: str = ";",
+    encoding: str | None = None,
+    top_k: int = 10,
+    sample_size: int = 10,
+    quantiles: list[float] = [0.0, 0.25, 0.5, 0.75, 0.95, 1.0],
+) -> dict[str, dict]:
+    """Profile the columns of a CSV file (with a header row) in a single pass, using bounded-memory sketches.
+
+    Per column the number of values, the number and rate of empty (null) values, the minimum and maximum, the approximate number of distinct values (HyperLogLog), the approximate quantiles of numeric columns, the approximate most frequent values (Misra-Gries) and a random sample of values (reservoir sampling) are returned.
+    A column is numeric if all non-empty values are numbers, the minimum and maximum of other columns are compared as strings.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `top_k` (`int`, optional): An integer representing the number of most frequent values per column. Defaults to `10`.
+        -   `sample_size` (`int`, optional): An integer representing the number of sampled values per column. Defaults to `10`.
+        -   `quantiles` (`list[float]`, optional): A list of floats representing the quantiles to estimate of numeric columns. Defaults to `[0.0, 0.25, 0.5, 0.75, 0.95, 1.0]`.
+
+    Returns:
+        -   `dict[str, dict]`: A dictionary containing the profile (a dictionary of statistics) by field name.
+    """
+    rows: Iterator[list] = iter_csv(file_path, delimiter, encoding)
+    header: list[str] = next(rows, [])
+    profiles: list[_ColumnProfile] = [
+        _ColumnProfile(top_k, sample_size) for _ in header
+    ]
+    for row in rows:
+        if not row:
+            continue
+        for profile, value in zip(profiles, row):
+            profile.add(value)
+        # Missing fields are empty values
+        for profile in profiles[len(row) :]:
+            profile.add("")
+    return {name: profile.report(quantiles) for name, profile in zip(header, profiles)}
+
+
+class _ColumnProfile:
+    """Accumulate the statistics and sketches of the values of a column."""
+
+    def __init__(self, top_k: int, sample_size: int) -> None:
+        self.count: int = 0
+        self.nulls: int = 0
+        self.numeric: bool = True
+        self.min: str | None = None
+        self.max: str | None = None
+        self.min_number: float | None = None
+        self.max_number: float | None = None
+        self.distinct = _HyperLogLog()
+        self.quantiles = _QuantileSketch()
+        self.top_k: int = top_k
+        self.counters: dict[str, int] = {}
+        self.sample: list[str] = []
+        self.sample_size: int = sample_size
+
+    def add(self, value: str) -> None:
+        self.count += 1
+        if value == "":
+            self.nulls += 1
+            return
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if self.numeric:
+            try:
+                number: float = float(value)
+            except ValueError:
+                self.numeric = False
+            else:
+                if self.min_number is None or number < self.min_number:
+                    self.min_number = number
+                if self.max_number is None or number > self.max_number:
+                    self.max_number = number
+                self.quantiles.add(number)
+        self.distinct.add(value)
+        self._count_frequent(value)
+        # Reservoir sampling, each value has the same probability to be sampled
+        filled: int = self.count - self.nulls
+        if len(self.sample) < self.sample_size:
+            self.sample.append(value)
+        elif random_float() * filled < self.sample_size:
+            self.sample[int(random_float() * self.sample_size)] = value
+
+    def _count_frequent(self, value: str) -> None:
+        """Count the frequent values (Misra-Gries), using at most ten counters per reported value."""
+        if value in self.counters:
+            self.counters[value] += 1
+        elif len(self.counters) < self.top_k * 10:
+            self.counters[value] = 1
+        else:
+            # Decrement all counters, remove the counters reaching zero
+            self.counters = {
+                key: count - 1 for key, count in self.counters.items() if count > 1
+            }
+
+    def report(self, quantiles: list[float]) -> dict:
+        filled: int = self.count - self.nulls
+        numeric: bool = self.numeric and filled > 0
+        estimates: dict[float, float | None] | None = None
+        if numeric:
+            estimates = self.quantiles.quantiles(quantiles)
+            # The minimum and maximum are known exactly
+            estimates.update(
+                {q: self.min_number for q in quantiles if q <= 0}
+                | {q: self.max_number for q in quantiles if q >= 1}
+            )
+        top: list[tuple[str, int]] = sorted(
+            self.counters.items(), key=lambda item: item[1], reverse=True
+        )[: self.top_k]
+        return {
+            "count": self.count,
+            "nulls": self.nulls,
+            "null_rate": self.nulls / self.count if self.count else 0.0,
+            "numeric": numeric,
+            "min": self.min_number if numeric else self.min,
+            "max": self.max_number if numeric else self.max,
+            "distinct": self.distinct.estimate(),
+            "quantiles": estimates,
+            "top": top,
+            "sample": self.sample,
+        }
+
+
+class _HyperLogLog:
+    """Estimate the number of distinct values (HyperLogLog), using `2 ** precision` registers."""
+
+    def __init__(self, precision: int = 14) -> None:
+        self.precision: int = precision
+        self.registers = bytearray(2**precision)
+
+    def add(self, value: str) -> None:
+        hashed: int = hash(value) & 0xFFFFFFFFFFFFFFFF
+        # The first bits select the register, the remaining bits give the rank
+        remaining_bits: int = 64 - self.precision
+        remaining: int = hashed & ((1 << remaining_bits) - 1)
+        rank: int = remaining_bits - remaining.bit_length() + 1
+        idx: int = hashed >> remaining_bits
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def estimate(self) -> int:
+        m: int = len(self.registers)
+        alpha: float = 0.7213 / (1 + 1.079 / m)
+        estimate: float = alpha * m * m / sum(2.0**-rank for rank in self.registers)
+        zeros: int = self.registers.count(0)
+        # Use linear counting for small cardinalities
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+
+class _QuantileSketch:
+    """Estimate quantiles of a stream of numbers with a hierarchy of compactors (KLL-like), keeping about `k` numbers per level."""
+
+    def __init__(self, k: int = 256) -> None:
+        self.k: int = k
+        self.levels: list[list[float]] = [[]]
+
+    def add(self, number: float) -> None:
+        self.levels[0].append(number)
+        if len(self.levels[0]) >= self.k:
+            self._compact()
+
+    def _compact(self) -> None:
+        for level, numbers in enumerate(self.levels):
+            if len(numbers) < self.k:
+                break
+            # Promote every other number (from a random offset) to the next level, with double weight
+            numbers.sort()
+            promoted: list[float] = numbers[int(random_float() * 2) :: 2]
+            numbers.clear()
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+            self.levels[level + 1].extend(promoted)
+
+    def quantiles(self, quantiles: list[float]) -> dict[float, float | None]:
+        weighted: list[tuple[float, int]] = sorted(
+            (number, 2**level)
+            for level, numbers in enumerate(self.levels)
+            for number in numbers
+        )
+        total: int = sum(weight for _, weight in weighted)
+        result: dict[float, float | None] = {}
+        for quantile in quantiles:
+            if not weighted:
+                result[quantile] = None
+                continue
+            rank: float = quantile * (total - 1)
+            cumulative: int = 0
+            result[quantile] = weighted[-1][0]
+            for number, weight in weighted:
+                cumulative += weight
+                if cumulative > rank:
+                    result[quantile] = number
+                    break
+        return result
+
+
+def _hash_join(
+    probe: Iterable[dict],
+    build: Iterable[dict],
+    on: list[str],
+    how: str,
+    build_left: bool,
+    build_fields: list[str],
+) -> Iterator[dict]:
+    """Join the streamed (probe) records against a hash table of the build records."""
+    table: dict[tuple, list[dict]] = {}
+    for record in build:
+        table.setdefault(tuple(record[field] for field in on), []).append(record)
+    missing: dict = {field: None for field in build_fields}
+    for record in probe:
+        matches: list[dict] | None = table.get(tuple(record[field] for field in on))
+        if how == "anti":
+            if matches is None:
+                yield record
+        elif matches is not None:
+            for match in matches:
+                if build_left:
+                    yield _join_records(match, record, on)
+                else:
+                    yield _join_records(record, match, on)
+        elif how == "left":
+            yield _join_records(record, missing, on)
+
+
+def _join_records(left: dict, right: dict, on: list[str]) -> dict:
+    """Merge a left and a right record, suffixing right fields which are also left fields."""
+    record: dict = dict(left)
+    for field, value in right.items():
+        if field in on:
+            continue
+        record[field + "_right" if field in left else field] = value
+    return record
+
+
+def diff_csv(
+    old_path: str,
+    new_path: str,
+    key_fields: list[str],
+    delimiter: str = ";",
+    encoding: str | None = None,
+    max_memory: int = 1024 * 1024 * 1024,
+    temp_dir: str | None = None,
+) -> Iterator[tuple[str, dict]]:
+    """Iterate over the changes between two snapshots of a CSV file (with header rows), matching the rows on the given (unique) key fields.
+
+    Only the key and a compact hash (8 bytes) of each old row are kept in memory, the new rows are streamed and compared against them.
+    If the old file is larger than the memory budget, both files are first partitioned on the key fields into temporary files, which are compared partition by partition.
+    The changes are yielded as `(change, record)` tuples, with the change `"insert"` (record of the new file), `"update"` (record of the new file) or `"delete"` (record of the old file).
+
+    Args:
+        -   `old_path` (`str`): A string representing the old source file path.
+        -   `new_path` (`str`): A string representing the new source file path.
+        -   `key_fields` (`list[str]`): A list of strings representing the field names identifying a row.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV files. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the files. Defaults to `None`.
+        -   `max_memory` (`int`, optional): An integer representing the maximum size (in bytes) of the old file compared in memory. Defaults to `1073741824` (1 GiB).
+        -   `temp_dir` (`str | None`, optional): A string representing the directory of the temporary partition files, `None` uses the temporary directory of the system. Defaults to `None`.
+
+    Returns:
+        -   `Iterator[tuple[str, dict]]`: An iterator of tuples containing the type of change and the changed record.
+    """
+    old_size: int = os.path.getsize(old_path)
+    if old_size <= max_memory:
+        yield from _diff_rows(old_path, new_path, key_fields, delimiter, encoding)
+        return
+    # Partition both files, rows with the same key end up in the same partition
+    nr_partitions: int = math.ceil(old_size / max_memory) * 2
+    with tempfile.TemporaryDirectory(dir=temp_dir) as partition_dir:
+        old_paths: list[str] = _partition_csv(
+            old_path, key_fields, nr_partitions, partition_dir, delimiter, encoding
+        )
+        new_paths: list[str] = _partition_csv(
+            new_path, key_fields, nr_partitions, partition_dir, delimiter, encoding
+        )
+        for old_partition, new_partition in zip(old_paths, new_paths):
+            yield from _diff_rows(
+                old_partition, new_partition, key_fields, delimiter, encoding
+            )
+
+
+def _diff_rows(
+    old_path: str,
+    new_path: str,
+    key_fields: list[str],
+    delimiter: str,
+    encoding: str | None = None,
+) -> Iterator[tuple[str, dict]]:
+    """Compare the rows of two CSV files in memory by key and row hash."""
+    old_rows: Iterator[list] = iter_csv(old_path, delimiter, encoding)
+    old_header: list[str] = next(old_rows, [])
+    old_indexes: list[int] = [old_header.index(field) for field in key_fields]
+    hashes: dict[tuple, bytes] = {}
+    for row in old_rows:
+        if row:
+            hashes[tuple(row[idx] for idx in old_indexes)] = _row_hash(row)
+    new_rows: Iterator[list] = iter_csv(new_path, delimiter, encoding)
+    new_header: list[str] = next(new_rows, [])
+    new_indexes: list[int] = [new_header.index(field) for field in key_fields]
+    for row in new_rows:
+        if not row:
+            continue
+        old_hash: bytes | None = hashes.pop(
+            tuple(row[idx] for idx in new_indexes), None
+        )
+        if old_hash is None:
+            yield "insert", dict(zip(new_header, row))
+        elif old_hash != _row_hash(row):
+            yield "update", dict(zip(new_header, row))
+    # The remaining old rows are deleted, read them again to yield the records
+    if hashes:
+        for row in iter_csv(old_path, delimiter, encoding):
+            if row and tuple(row[idx] for idx in old_indexes) in hashes:
+                yield "delete", dict(zip(old_header, row))
+
+
+def _row_hash(row: list[str]) -> bytes:
+    """Return a compact (8 bytes) hash of the values of a row."""
+    return hashlib.blake2b("\x1f".join(row).encode(), digest_size=8).digest()
+
+
+def _partition_csv(
+    file_path: str,
+    key_fields: list[str],
+    nr_partitions: int,
+    partition_dir: str,
+    delimiter: str = ";",
+    encoding: str | None = None,
+) -> list[str]:
+    """Split a CSV file (with a header row) into partition files by the hash of the key fields."""
+    rows: Iterator[list] = filter(None, iter_csv(file_path, delimiter, encoding))
+    header: list[str] = next(rows, [])
+    indexes: list[int] = [header.index(field) for field in key_fields]
+    name: str = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()[:8]
+    paths: list[str] = [
+        os.path.join(partition_dir, f"{name}_{idx}.csv") for idx in range(nr_partitions)
+    ]
+    files: list = [open(path, "w", encoding=encoding, newline="") for path in paths]
+    try:
+        writers: list = [csv.writer(f, delimiter=delimiter) for f in files]
+        for writer in writers:
+            writer.writerow(header)
+        for row in rows:
+            key: tuple = tuple(row[idx] if idx < len(row) else None for idx in indexes)
+            writers[hash(key) % nr_partitions].writerow(row)
+    finally:
+        for f in files:
+            f.close()
+    return paths
+
+
+def load_csv_sqlite(
+    file_path: str,
+    db_path: str,
+    table: str | None = None,
+    delimiter: str = ";",
+    encoding: str | None = None,
+    indexes: list[str | list[str]] = [],
+    pragmas: dict[str, str | int] = {"journal_mode": "WAL", "synchronous": "OFF"},
+    batch_size: int = 100000,
+) -> str:
+    """Load the records of a CSV file (with a header row) into a (new) table of a SQLite database.
+
+    The rows are streamed into the table in batches (`executemany()`) within a single transaction, the indexes are created after loading the rows.
+    All columns are stored as text, an existing table with the same name is replaced.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `db_path` (`str`): A string representing the SQLite database file path.
+        -   `table` (`str | None`, optional): A string representing the name of the table, `None` uses the name of the source file (without extension). Defaults to `None`.
+        -   `delimiter` (`str`, optional): A string representing the delimiter of the CSV file. Defaults to `";"`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `indexes` (`list[str | list[str]]`, optional): A list of field names (or lists of field names) to create an index on. Defaults to `[]`.
+        -   `pragmas` (`dict[str, str | int]`, optional): A dictionary representing the SQLite PRAGMA statements executed before loading (e.g. `{"cache_size": -262144}`). Defaults to `{"journal_mode": "WAL", "synchronous": "OFF"}`.
+        -   `batch_size` (`int`, optional): An integer representing the number of rows inserted per `executemany()` call. Defaults to `100000`.
+
+    Returns:
+        -   `str`: A string representing the SQLite database file path.
+    """
+    table = table or os.path.splitext(os.path.basename(file_path))[0]
+    rows: Iterator[list] = iter_csv(file_path, delimiter, encoding)
+    header: list[str] = next(rows, [])
+    nr_fields: int = len(header)
+    columns: str = ", ".join(_quote_identifier(name) for name in header)
+    connection = sqlite3.connect(db_path)
+    try:
+        for name, value in pragmas.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+        with connection:
+            connection.execute(f"DROP TABLE IF EXISTS {_quote_identifier(table)}")
+            connection.execute(f"CREATE TABLE {_quote_identifier(table)} ({columns})")
+            insert: str = (
+                f"INSERT INTO {_quote_identifier(table)} VALUES "
+                f"({', '.join('?' * nr_fields)})"
+            )
+            for batch in _batched(rows, batch_size):
+                # Pad or truncate the rows to the number of fields, skip empty rows
+                connection.executemany(
+                    insert,
+                    (
+                        (
+                            row
+                            if len(row) == nr_fields
+                            else (row + [None] * nr_fields)[:nr_fields]
+                        )
+                        for row in batch
+                        if row
+                    ),
+                )
+            for index in indexes:
+                fields: list[str] = [index] if isinstance(index, str) else index
+                index_name: str = "_".join([table, *fields, "idx"])
+                connection.execute(
+                    f"CREATE INDEX {_quote_identifier(index_name)} ON "
+                    f"{_quote_identifier(table)} "
+                    f"({', '.join(_quote_identifier(field) for field in fields)})"
+                )
+    finally:
+        connection.close()
+    return db_path
+
+
+def query_csv_sqlite(
+    db_path: str,
+    table: str,
+    where: dict[str, str] = {},
+    columns: list[str] | None = None,
+    limit: int = 0,
+    row_type: str = "dict",
+) -> list[dict]:
+    """Query the records of a table loaded by `load_csv_sqlite()`, matching the given field values (which can use the indexes).
+
+    The records have the same shapes as the records of `read_csv_records()` (see `row_type`).
+
+    Args:
+        -   `db_path` (`str`): A string representing the SQLite database file path.
+        -   `table` (`str`): A string representing the name of the table.
+        -   `where` (`dict[str, str]`, optional): A dictionary representing the values the fields have to be equal to (e.g. `{"ID": "42"}`). Defaults to `{}`.
+        -   `columns` (`list[str] | None`, optional): A list of strings representing the field names to include in the records, `None` includes all fields. Defaults to `None`.
+        -   `limit` (`int`, optional): An integer representing the maximum number of returned records, `0` returns all matching records. Defaults to `0`.
+        -   `row_type` (`str`, optional): A string representing the type of the records, `"dict"`, `"namedtuple"`, `"slots"` or `"tuple"`. Defaults to `"dict"`.
+
+    Returns:
+        -   `list[dict]`: A list of dictionaries (or compact records) representing the matching records.
+    """
+    selection: str = (
+        ", ".join(_quote_identifier(name) for name in columns) if columns else "*"
+    )
+    query: str = f"SELECT {selection} FROM {_quote_identifier(table)}"
+    if where:
+        query += " WHERE " + " AND ".join(
+            f"{_quote_identifier(name)} = ?" for name in where
+        )
+    if limit > 0:
+        query += f" LIMIT {int(limit)}"
+    connection = sqlite3.connect(db_path)
+    try:
+        cursor: sqlite3.Cursor = connection.execute(query, list(where.values()))
+        keys: list[str] = [description[0] for description in cursor.description]
+        make_record: Callable[[list], object] = _record_factory(keys, row_type)
+        records: list = [tuple(keys)] if row_type == "tuple" else []
+        for row in cursor:
+            records.append(make_record(row))
+    finally:
+        connection.close()
+    return records
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a SQLite identifier (e.g. a table or column name)."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _read_csv_chunk(
+    file_path: str, start: int, stop: int, delimiter: str, encoding: str | None
+) -> list[list]:
+    """Parse the rows of the given byte range of a CSV file (executed by a worker process)."""
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        data: bytes = f.read(stop - start)
+    # Decode the chunk the same way as a file opened in the read mode
+    with io.TextIOWrapper(io.BytesIO(data), encoding=encoding) as text:
+        return list(csv.reader(text, delimiter=delimiter))
+
+
+def _collect_futures(pending: list[Future], ordered: bool) -> Iterator:
+    """Yield the result of the first pending future, or of all completed futures if the order is irrelevant."""
+    if ordered:
+        yield pending.pop(0).result()
+        return
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield future.result()
+
+
+@lru_cache
+def _csv_record_patterns(separator: bytes) -> tuple[re.Pattern, re.Pattern]:
+    """Compile the patterns matching one and any number of complete CSV records (ending with a newline), following the quoting rules of `csv.reader`.
+
+    A quote only opens a quoted field at the start of a field (at the start of a line or after a delimiter), other quotes are literal characters.
+    Within a quoted field `""` is an escaped quote, the field continues (unquoted) up to the next delimiter after the closing quote.
+    """
+    if len(separator) == 1:
+        other: bytes = b"[^" + re.escape(separator) + b"\n]"
+        unquoted: bytes = b"[^" + re.escape(separator) + b'\n"]'
+    else:
+        other = b"(?:(?!" + re.escape(separator) + b")[^\n])"
+        unquoted = b"(?:(?!" + re.escape(separator) + b')[^\n"])'
+    field: bytes = (
+        b'(?:"[^"]*+(?:""[^"]*+)*+"' + other + b"*+|" + unquoted + other + b"*+|)"
+    )
+    record: bytes = field + b"(?:" + re.escape(separator) + field + b")*+\n"
+    return re.compile(record), re.compile(b"(?:" + record + b")*+")
+
+
+def _csv_chunk_offsets(file_path: str, chunk_size: int, separator: bytes) -> list[int]:
+    """Return the byte offsets splitting a CSV file into chunks of (approximately) the given size at record boundaries (see `_csv_record_patterns()`)."""
+    record, records = _csv_record_patterns(separator)
+    size: int = os.path.getsize(file_path)
+    offsets: list[int] = [0]
+    target: int = chunk_size
+    # The data read since the last known record boundary (at the offset `position`)
+    data: bytes = b""
+    position: int = 0
+    with open(file_path, "rb") as f:
+        while target < size:
+            block: bytes = f.read(1024 * 1024)
+            if not block:
+                break
+            data += block
+            end: int = 0
+            while target < position + len(data):
+                # The last record boundary up to the target offset and the first one after it
+                end = records.match(data, end, max(end, target - position)).end()
+                if position + end < target:
+                    match = record.match(data, end)
+                    if match is None:
+                        # The record continues in the next block
+                        break
+                    end = match.end()
+                offsets.append(position + end)
+                target = position + end + chunk_size
+            end = records.match(data, end).end()
+            data = data[end:]
+            position += end
+    if offsets[-1] != size:
+        offsets.append(size)
+    return offsets
+
+
+def _batched(iterable: Iterable, batch_size: int) -> Iterator[list]:
+    """Split an iterable into lists of (at most) the given size."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
 def example_function():
     """Example of use:
     Create, append and read random example records to a CSV file.
@@ -135,8 +2247,9 @@ def example_function():
     # Create CSV file with field names
     create_csv(file_path, field_names)
     # Append records to CSV file
-    for record in records:
-        append_csv_record(file_path, field_names, record)
+    with CsvAppender(file_path, field_names) as appender:
+        for record in records:
+            appender.append(record)
     # Read records from CSV file
     result: list[dict] = read_csv_records(file_path)
     pp(result)
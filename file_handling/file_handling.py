@@ -2,6 +2,7 @@ import xmltodict  # https://pypi.org/project/xmltodict/ - This module is not bui
 
 import tkinter as tk
 from tkinter import filedialog, messagebox
+import mmap
 import os
 import re
 from datetime import datetime
@@ -180,6 +181,43 @@ def read_file(file_path: str, encoding: str | None = None) -> str:
     return data
 
 
+def read_file_mmap(file_path: str) -> "mmap.mmap | _EmptyMmap":
+    """Map the data of a file (read-only) into memory, without reading or decoding the file.
+
+    The mapped pages are loaded on access and shared (through the page cache) with other processes mapping the same file.
+    Slices of the returned object are bytes, use `memoryview()` for zero-copy slices and call `close()` (or use a `with` statement) to unmap the file when done.
+    An empty file can not be mapped, it returns empty bytes which can be used (and closed) the same way.
+
+    Args:
+        -   `file_path` (`str`): A string representing the file path.
+
+    Returns:
+        -   `mmap.mmap | _EmptyMmap`: A memory-mapped file object containing the data of the given file, or closable empty bytes if the file is empty.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _EmptyMmap()
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class _EmptyMmap(bytes):
+    """Empty bytes standing in for the memory map of an empty file, with the `close()` and `with` statement support of `mmap.mmap`."""
+
+    closed: bool = False
+
+    def __enter__(self) -> "_EmptyMmap":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.closed = True
+
+    def size(self) -> int:
+        return 0
+
+
 def read_xml(file_path: str) -> OrderedDict:
     """Read the data from a XML file and return it as an ordered dictionary.
 
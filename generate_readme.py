@@ -100,7 +100,8 @@ class PythonClass:
             self._add_content(line)
 
     def set_name(self, line: str) -> None:
-        self.name = line[line.index("class ") + 6 : line.index("(")] + "()"
+        name: str = line[line.index("class ") + 6 :].split(":")[0]
+        self.name = name.split("(")[0] + "()"
         self.en_content = True
 
     def _add_content(self, line: str) -> None:
@@ -1,34 +1,675 @@
 import json
+import os
+import re
+import sys
+import threading
+import timeit
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from types import MappingProxyType
+from typing import TextIO
 
+try:
+    import orjson  # https://github.com/ijl/orjson - This module is not build-in with Python
+except ImportError:
+    orjson = None
+try:
+    import simdjson  # https://github.com/TkTech/pysimdjson - This module is not build-in with Python
+except ImportError:
+    simdjson = None
+try:
+    import ujson  # https://github.com/ultrajson/ultrajson - This module is not build-in with Python
+except ImportError:
+    ujson = None
 
-def read_json(file_path: str, mode: str = "r") -> dict | list | str | int | bool | None:
+
+def read_json(
+    file_path: str, mode: str = "r", backend: str = "json"
+) -> dict | list | str | int | bool | None:
     """Read the data from a given JSON file path.
 
+    The data is decoded by the given backend: `"json"` (built-in), `"orjson"`, `"ujson"` or `"simdjson"` if installed, or `"auto"` for the fastest installed backend.
+    The `"json"` backend reads the file as text (in the default encoding of the system), the other backends read the file as bytes (UTF-8).
+    Files written by the other backends contain UTF-8 text, read them with one of those backends (e.g. `"auto"`) on systems with another default encoding.
+
     Args:
         -   `file_path` (`str`): A string representing the source file path.
         -   `mode` (`str`, optional): An string representing the mode in which the file is opened (e.g. `"w"` for write, `"a"` for append). Defaults to `"r"`.
+        -   `backend` (`str`, optional): A string representing the JSON backend decoding the data. Defaults to `"json"`.
 
     Returns:
         -   `dict | list | str | int | bool | None`: The data from the JSON file.
     """
-    with open(file_path, mode) as f:
-        data: dict | list | str | int | bool | None = json.load(f)
+    if backend == "json":
+        with open(file_path, mode) as f:
+            data: dict | list | str | int | bool | None = json.load(f)
+        return data
+    loads, _ = _get_json_backend(backend)
+    with open(file_path, mode.replace("b", "") + "b") as f:
+        data = loads(f.read())
     return data
 
 
 def write_json(
-    data: dict | list | str | int | bool | None, file_path: str, mode: str = "w"
+    data: dict | list | str | int | bool | None,
+    file_path: str,
+    mode: str = "w",
+    backend: str = "json",
+    compact: bool = False,
 ) -> str:
     """Write the data into a JSON file.
 
+    The data is encoded by the given backend: `"json"` (built-in), `"orjson"` or `"ujson"` if installed, or `"auto"` for the fastest installed backend (`"simdjson"` encodes with `"json"`).
+    The data is indented (4 spaces, 2 spaces for `"orjson"`) unless `compact`, compact data has no whitespace.
+    The `"json"` backend writes text (in the default encoding and newlines of the system) with non-ASCII characters as escape sequences, so `read_json()` can always read it.
+    The other backends write bytes, with non-ASCII characters as UTF-8 (see `read_json()`).
+
     Args:
         -   `data` (`dict | list | str | int | bool | None`): Any valid JSON data.
         -   `file_path` (`str`): A string representing the destination file path.
         -   `mode` (`str`, optional): An string representing the mode in which the file is opened (e.g. `"w"` for write, `"a"` for append). Defaults to `"w"`.
+        -   `backend` (`str`, optional): A string representing the JSON backend encoding the data. Defaults to `"json"`.
+        -   `compact` (`bool`, optional): A boolean, `True` to write compact data, `False` to write indented data. Defaults to `False`.
 
     Returns:
         -   `str`: A string representing the destination file path.
     """
-    with open(file_path, mode) as f:
-        json.dump(data, f, indent=4)
+    if backend == "json":
+        with open(file_path, mode) as f:
+            if compact:
+                json.dump(data, f, separators=(",", ":"))
+            else:
+                json.dump(data, f, indent=4)
+        return file_path
+    _, dumps = _get_json_backend(backend)
+    with open(file_path, mode.replace("b", "") + "b") as f:
+        f.write(dumps(data, compact))
     return file_path
+
+
+def benchmark_json_backends(
+    data: dict | list | str | int | bool | None = None,
+    backends: list[str] | None = None,
+    compact: bool = True,
+    repeat: int = 5,
+) -> dict[str, dict[str, float]]:
+    """Measure the encoding and decoding durations of the JSON backends for the given data.
+
+    Args:
+        -   `data` (`dict | list | str | int | bool | None`, optional): Any valid JSON data, representative for the workload, `None` uses a list of 10000 example records. Defaults to `None`.
+        -   `backends` (`list[str] | None`, optional): A list of strings representing the backends to measure, `None` measures all installed backends. Defaults to `None`.
+        -   `compact` (`bool`, optional): A boolean, `True` to encode compact data, `False` to encode indented data. Defaults to `True`.
+        -   `repeat` (`int`, optional): An integer representing the number of measurements, the fastest one is used. Defaults to `5`.
+
+    Returns:
+        -   `dict[str, dict[str, float]]`: A dictionary containing the (fastest) `"dumps"` and `"loads"` duration in seconds and the encoded `"size"` in bytes by backend.
+    """
+    if data is None:
+        data = [
+            {
+                "id": i,
+                "name": f"Record {i}",
+                "value": i * 0.25,
+                "active": i % 2 == 0,
+                "tags": ["example", str(i % 10)],
+                "parent": None,
+            }
+            for i in range(10000)
+        ]
+    results: dict[str, dict[str, float]] = {}
+    for backend in backends or list(_JSON_BACKENDS):
+        loads, dumps = _get_json_backend(backend)
+        encoded: bytes = dumps(data, compact)
+        results[backend] = {
+            "dumps": min(
+                timeit.repeat(lambda: dumps(data, compact), number=1, repeat=repeat)
+            ),
+            "loads": min(
+                timeit.repeat(lambda: loads(encoded), number=1, repeat=repeat)
+            ),
+            "size": len(encoded),
+        }
+    return results
+
+
+def _json_dumps(data: object, compact: bool) -> bytes:
+    """Encode the data with the built-in `json` module."""
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+    return json.dumps(data, indent=4).encode()
+
+
+def _orjson_dumps(data: object, compact: bool) -> bytes:
+    """Encode the data with `orjson`."""
+    option: int = orjson.OPT_NON_STR_KEYS
+    if not compact:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, option=option)
+
+
+def _ujson_dumps(data: object, compact: bool) -> bytes:
+    """Encode the data with `ujson`."""
+    if compact:
+        return ujson.dumps(data, ensure_ascii=False).encode()
+    return ujson.dumps(data, indent=4).encode()
+
+
+# Decoding (bytes) and encoding (data, compact) functions of the installed backends, the fastest first
+_JSON_BACKENDS: dict[
+    str, tuple[Callable[[bytes], object], Callable[[object, bool], bytes]]
+] = {}
+if orjson is not None:
+    _JSON_BACKENDS["orjson"] = (orjson.loads, _orjson_dumps)
+if simdjson is not None:
+    _JSON_BACKENDS["simdjson"] = (simdjson.loads, _json_dumps)
+if ujson is not None:
+    _JSON_BACKENDS["ujson"] = (ujson.loads, _ujson_dumps)
+_JSON_BACKENDS["json"] = (json.loads, _json_dumps)
+
+
+def _get_json_backend(
+    backend: str,
+) -> tuple[Callable[[bytes], object], Callable[[object, bool], bytes]]:
+    """Return the decoding and encoding function of a (installed) backend, `"auto"` for the fastest one."""
+    if backend == "auto":
+        return next(iter(_JSON_BACKENDS.values()))
+    if backend not in _JSON_BACKENDS:
+        raise ValueError(
+            f"Unknown or not installed JSON backend: {backend!r}, installed: {', '.join(_JSON_BACKENDS)}"
+        )
+    return _JSON_BACKENDS[backend]
+
+
+def iter_jsonl(
+    file_path: str,
+    workers: int = 0,
+    batch_size: int = 10000,
+    skip_errors: bool = False,
+    stats: dict | None = None,
+    backend: str = "json",
+) -> Iterator[dict | list | str | int | bool | None]:
+    """Lazily read the data from a given JSON Lines file path, one JSON value per line.
+
+    The file is read in batches of lines, with `workers` the batches are decoded in parallel worker processes (the number of batches in progress is bounded to twice the number of workers) and yielded in the original order. Empty lines are ignored.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `workers` (`int`, optional): An integer representing the number of worker processes decoding the batches, `0` decodes the batches in the current process. Defaults to `0`.
+        -   `batch_size` (`int`, optional): An integer representing the number of lines per batch. Defaults to `10000`.
+        -   `skip_errors` (`bool`, optional): A boolean, `True` to skip (and count) malformed lines, `False` to raise a `ValueError` on a malformed line. Defaults to `False`.
+        -   `stats` (`dict | None`, optional): A dictionary updated with the number of read `"lines"`, decoded `"records"` and skipped `"errors"`. Defaults to `None`.
+        -   `backend` (`str`, optional): A string representing the JSON backend decoding the lines (see `read_json()`). Defaults to `"json"`.
+
+    Returns:
+        -   `Iterator[dict | list | str | int | bool | None]`: An iterator of the data from each line of the JSON Lines file.
+    """
+    if stats is None:
+        stats = {}
+    stats.update({"lines": 0, "records": 0, "errors": 0})
+    with open(file_path, "rb") as f:
+        batches: Iterator[list[bytes]] = iter(lambda: list(islice(f, batch_size)), [])
+        if workers <= 0:
+            for batch in batches:
+                records, errors = _decode_jsonl(
+                    batch, stats["lines"], skip_errors, backend
+                )
+                yield from _count_jsonl(stats, len(batch), records, errors)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: list[tuple[int, Future]] = []
+            for batch in batches:
+                first_line: int = stats["lines"] + sum(size for size, _ in pending)
+                pending.append(
+                    (
+                        len(batch),
+                        executor.submit(
+                            _decode_jsonl, batch, first_line, skip_errors, backend
+                        ),
+                    )
+                )
+                # Wait for a batch if the maximum number of batches are in progress
+                if len(pending) >= workers * 2:
+                    size, future = pending.pop(0)
+                    yield from _count_jsonl(stats, size, *future.result())
+            for size, future in pending:
+                yield from _count_jsonl(stats, size, *future.result())
+
+
+def write_jsonl(
+    data: Iterable[dict | list | str | int | bool | None],
+    file_path: str,
+    mode: str = "w",
+    buffer_size: int = 1024 * 1024,
+    backend: str = "json",
+) -> str:
+    """Write the data into a JSON Lines file, one (compact) JSON value per line.
+
+    The lines are joined and written in blocks of (approximately) the given buffer size, so any iterable (e.g. a generator) can be written in constant memory.
+
+    Args:
+        -   `data` (`Iterable[dict | list | str | int | bool | None]`): An iterable of valid JSON data.
+        -   `file_path` (`str`): A string representing the destination file path.
+        -   `mode` (`str`, optional): An string representing the mode in which the file is opened (e.g. `"w"` for write, `"a"` for append). Defaults to `"w"`.
+        -   `buffer_size` (`int`, optional): An integer representing the size (in bytes) of the written blocks. Defaults to `1048576` (1 MiB).
+        -   `backend` (`str`, optional): A string representing the JSON backend encoding the data (see `write_json()`). Defaults to `"json"`.
+
+    Returns:
+        -   `str`: A string representing the destination file path.
+    """
+    _, dumps = _get_json_backend(backend)
+    with open(file_path, mode.replace("b", "") + "b") as f:
+        lines: list[bytes] = []
+        size: int = 0
+        for record in data:
+            line: bytes = dumps(record, True) + b"\n"
+            lines.append(line)
+            size += len(line)
+            if size >= buffer_size:
+                f.write(b"".join(lines))
+                lines.clear()
+                size = 0
+        f.write(b"".join(lines))
+    return file_path
+
+
+def _decode_jsonl(
+    lines: list[bytes], first_line: int, skip_errors: bool, backend: str
+) -> tuple[list, int]:
+    """Decode a batch of JSON Lines, return the decoded values and the number of malformed lines."""
+    loads, _ = _get_json_backend(backend)
+    records: list = []
+    errors: int = 0
+    for number, line in enumerate(lines, first_line + 1):
+        if not line.strip():
+            continue
+        try:
+            records.append(loads(line))
+        except ValueError as error:
+            if not skip_errors:
+                raise ValueError(f"Malformed JSON on line {number}: {error}") from None
+            errors += 1
+    return records, errors
+
+
+def _count_jsonl(stats: dict, lines: int, records: list, errors: int) -> list:
+    """Update the statistics of `iter_jsonl()` with a decoded batch and return its values."""
+    stats["lines"] += lines
+    stats["records"] += len(records)
+    stats["errors"] += errors
+    return records
+
+
+def iter_json_array(
+    file_path: str,
+    key_path: str = "",
+    encoding: str | None = None,
+    chunk_size: int = 1024 * 1024,
+) -> Iterator[dict | list | str | int | bool | None]:
+    """Lazily read the elements of a (huge) JSON array from a given JSON file path, one element at a time.
+
+    The file is read in chunks into a sliding buffer from which the elements are decoded one by one, so only (approximately) one element is kept in memory. The array is either the top-level value or the value at a key path of nested objects (e.g. `"data.records"`), other values on the way are skipped without being decoded.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `key_path` (`str`, optional): A string representing the dot-separated keys of the array within nested objects, `""` for a top-level array. Defaults to `""`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `chunk_size` (`int`, optional): An integer representing the (minimum) number of characters read at once. Defaults to `1048576` (1 MiB).
+
+    Returns:
+        -   `Iterator[dict | list | str | int | bool | None]`: An iterator of the elements of the JSON array.
+    """
+    with open(file_path, encoding=encoding) as f:
+        stream = _JsonStream(f, chunk_size)
+        # Find the array
+        for key in key_path.split(".") if key_path else []:
+            stream.find_key(key)
+        # Get the elements
+        for _ in stream.iter_array():
+            yield stream.decode()
+
+
+class _JsonStream:
+    """A sliding buffer over a JSON text file, decoding (or skipping) one value at a time."""
+
+    _WHITESPACE = re.compile(r"[ \t\n\r]*")
+    # Anything but brackets (including whole strings), followed by a bracket, an unterminated string or the end
+    _TOKEN = re.compile(
+        r'(?:[^"\[\]{}]++|"[^"\\]*+(?:\\.[^"\\]*+)*+")*+([\[\]{}"]|\Z)', re.S
+    )
+    _NUMBER_END = re.compile(r"[0-9.eE+\-]*\Z")
+
+    def __init__(self, file: TextIO, chunk_size: int) -> None:
+        self.file: TextIO = file
+        self.chunk_size: int = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer: str = ""
+        self.pos: int = 0
+        self.eof: bool = False
+
+    def fill(self) -> bool:
+        """Drop the consumed part of the buffer and read the next chunk, return `False` at the end of the file."""
+        # Read at least the size of the kept part, so (re)decoding a large value takes linear time
+        data: str = self.file.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        self.buffer = self.buffer[self.pos :] + data
+        self.pos = 0
+        self.eof = not data
+        return not self.eof
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, `""` at the end of the file."""
+        if self.pos < len(self.buffer) and self.buffer[self.pos] not in " \t\n\r":
+            return self.buffer[self.pos]
+        while True:
+            self.pos = self._WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the given (structural) character."""
+        found: str = self.peek()
+        if found != char:
+            raise self.error(
+                f"Expecting {char!r}" if found else "Unexpected end of data"
+            )
+        self.pos += 1
+
+    def decode(self) -> dict | list | str | int | bool | None:
+        """Decode the next value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                # The value may continue in the next chunk if the error is at the end of the buffer
+                # (within a literal, number or escape sequence), otherwise the value is malformed
+                truncated: bool = (
+                    e.msg.startswith("Unterminated string")
+                    or len(self.buffer) - e.pos <= 16
+                )
+                if truncated and self.fill():
+                    continue
+                raise
+            # A number (e.g. `12` of `1234` or `1.5`) may continue in the next chunk
+            if self._NUMBER_END.match(self.buffer, end) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def skip(self) -> None:
+        """Skip the next value, an array or object is scanned for its closing bracket without decoding (or validating) it."""
+        if self.peek() not in ("[", "{"):
+            self.decode()
+            return
+        depth: int = 0
+        while True:
+            match = self._TOKEN.match(self.buffer, self.pos)
+            token: str = match[1]
+            if token in ("", '"'):
+                # The end of the buffer or a string continuing in the next chunk
+                self.pos = match.start(1)
+                if not self.fill():
+                    raise self.error("Unexpected end of data")
+                continue
+            self.pos = match.end()
+            depth += 1 if token in ("[", "{") else -1
+            if depth == 0:
+                return
+
+    def iter_object(self) -> Iterator[str]:
+        """Consume the next object and yield its keys, the value of each key has to be consumed (decoded or skipped) before the next key."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self.error("Expecting property name enclosed in double quotes")
+            key: str = self.decode()
+            self.expect(":")
+            yield key
+            if self.peek() == "}":
+                self.pos += 1
+                return
+            self.expect(",")
+
+    def iter_array(self) -> Iterator[int]:
+        """Consume the next array and yield the indexes of its elements, each element has to be consumed (decoded or skipped) before the next index."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        index: int = 0
+        while True:
+            yield index
+            if self.peek() == "]":
+                self.pos += 1
+                return
+            self.expect(",")
+            index += 1
+
+    def find_key(self, key: str) -> None:
+        """Consume the next object up to (and including) the colon after the given key."""
+        for name in self.iter_object():
+            if name == key:
+                return
+            self.skip()
+        raise KeyError(key)
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        """Return a decoding error at the current position."""
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+
+def read_json_paths(
+    file_path: str,
+    paths: list[str],
+    default: object = None,
+    encoding: str | None = None,
+    chunk_size: int = 1024 * 1024,
+) -> dict[str, object]:
+    """Read only the data at the given paths from a given JSON file path, without decoding the rest of the document.
+
+    A path consists of dot-separated keys and array indexes (e.g. `"meta.version"`, `"items[0]"` or `"items[*].id"`), `[*]` matches every element of an array.
+    The document is scanned once: values on a path are decoded, other values are skipped without being decoded, and the scan stops as soon as all paths (without `[*]`) are found.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `paths` (`list[str]`): A list of strings representing the paths of the data to read.
+        -   `default` (`object`, optional): The value given to paths (without `[*]`) that do not exist. Defaults to `None`.
+        -   `encoding` (`str | None`, optional): A string representing the encoding of the file. Defaults to `None`.
+        -   `chunk_size` (`int`, optional): An integer representing the (minimum) number of characters read at once. Defaults to `1048576` (1 MiB).
+
+    Returns:
+        -   `dict[str, object]`: A dictionary containing the data by path, a list of all matches for paths with `[*]`.
+    """
+    steps: dict[str, list] = {path: _parse_json_path(path) for path in paths}
+    matches: dict[str, list] = {path: [] for path in paths}
+    # Paths which may still match, paths without wildcards are complete after the first match
+    pending: set[str] = set(paths)
+    if paths:
+        with open(file_path, encoding=encoding) as f:
+            stream = _JsonStream(f, chunk_size)
+            _scan_json_paths(stream, list(steps.items()), matches, pending)
+    data: dict[str, object] = {}
+    for path in paths:
+        if ... in steps[path]:
+            data[path] = matches[path]
+        else:
+            data[path] = matches[path][0] if matches[path] else default
+    return data
+
+
+_JSON_PATH_STEP = re.compile(r"(?:^|\.)([^.\[\]]+)|\[(\*|\d+)\]")
+
+
+def _parse_json_path(path: str) -> list:
+    """Parse a path into a list of keys (`str`), indexes (`int`) and wildcards (`...`)."""
+    steps: list = []
+    end: int = 0
+    while end < len(path):
+        match = _JSON_PATH_STEP.match(path, end)
+        if match is None:
+            raise ValueError(f"Invalid JSON path: {path!r}")
+        key, index = match.groups()
+        if key is not None:
+            steps.append(key)
+        else:
+            steps.append(... if index == "*" else int(index))
+        end = match.end()
+    return steps
+
+
+def _scan_json_paths(
+    stream: _JsonStream, states: list[tuple[str, list]], matches: dict, pending: set
+) -> None:
+    """Scan the next value for the (remaining) steps of the paths, add the decoded matches."""
+    if any(not steps for _, steps in states):
+        # Decode the value and get the (remaining) steps of the other paths from it
+        value = stream.decode()
+        for path, steps in states:
+            for match in _resolve_json_path(value, steps):
+                matches[path].append(match)
+                if "[*]" not in path:
+                    pending.discard(path)
+        return
+    char: str = stream.peek()
+    if char == "{":
+        for key in stream.iter_object():
+            next_states = [
+                (path, steps[1:]) for path, steps in states if steps[0] == key
+            ]
+            if next_states:
+                _scan_json_paths(stream, next_states, matches, pending)
+            else:
+                stream.skip()
+            if not pending:
+                return
+    elif char == "[":
+        for index in stream.iter_array():
+            next_states = [
+                (path, steps[1:])
+                for path, steps in states
+                if steps[0] is ... or steps[0] == index
+            ]
+            if next_states:
+                _scan_json_paths(stream, next_states, matches, pending)
+            else:
+                stream.skip()
+            if not pending:
+                return
+    else:
+        stream.skip()
+
+
+def _resolve_json_path(value: object, steps: list) -> Iterator:
+    """Yield the matches of the steps of a path within decoded data."""
+    if not steps:
+        yield value
+    elif steps[0] is ...:
+        if isinstance(value, list):
+            for item in value:
+                yield from _resolve_json_path(item, steps[1:])
+    elif isinstance(steps[0], int):
+        if isinstance(value, list) and steps[0] < len(value):
+            yield from _resolve_json_path(value[steps[0]], steps[1:])
+    elif isinstance(value, dict) and steps[0] in value:
+        yield from _resolve_json_path(value[steps[0]], steps[1:])
+
+
+# Cached data by file path and freeze: the size and modification time of the file, the estimated size and the data
+_JSON_CACHE: OrderedDict[tuple[str, bool], tuple[int, int, int, object]] = OrderedDict()
+_JSON_CACHE_STATS: dict[str, int] = {"hits": 0, "misses": 0, "size": 0}
+_JSON_CACHE_LOCK = threading.Lock()
+
+
+def read_json_cached(
+    file_path: str,
+    freeze: bool = False,
+    max_cache_size: int = 64 * 1024 * 1024,
+    backend: str = "json",
+) -> dict | list | str | int | bool | None | MappingProxyType | tuple:
+    """Read the data from a given JSON file path, using an in-memory cache of the decoded data.
+
+    A cached entry is outdated (and replaced) if the size or the modification time of the JSON file changed, the least recently used entries are removed if the total estimated size of the cached data exceeds the maximum size.
+    The cached data is shared by all callers, frozen data (read-only dictionaries and tuples instead of lists) can not be modified by accident.
+
+    Args:
+        -   `file_path` (`str`): A string representing the source file path.
+        -   `freeze` (`bool`, optional): A boolean, `True` to return frozen data (`MappingProxyType` instead of `dict`, `tuple` instead of `list`). Defaults to `False`.
+        -   `max_cache_size` (`int`, optional): An integer representing the maximum total estimated size (in bytes) of the cached data. Defaults to `67108864` (64 MiB).
+        -   `backend` (`str`, optional): A string representing the JSON backend decoding the data (see `read_json()`). Defaults to `"json"`.
+
+    Returns:
+        -   `dict | list | str | int | bool | None | MappingProxyType | tuple`: The (cached) data from the JSON file.
+    """
+    key: tuple[str, bool] = (os.path.abspath(file_path), freeze)
+    stat: os.stat_result = os.stat(file_path)
+    with _JSON_CACHE_LOCK:
+        entry = _JSON_CACHE.get(key)
+        if entry is not None and entry[:2] == (stat.st_size, stat.st_mtime_ns):
+            _JSON_CACHE_STATS["hits"] += 1
+            # Mark the entry as recently used
+            _JSON_CACHE.move_to_end(key)
+            return entry[3]
+        _JSON_CACHE_STATS["misses"] += 1
+    data = read_json(file_path, backend=backend)
+    size: int = _estimate_size(data)
+    if freeze:
+        data = _freeze_json(data)
+    with _JSON_CACHE_LOCK:
+        if key in _JSON_CACHE:
+            _JSON_CACHE_STATS["size"] -= _JSON_CACHE.pop(key)[2]
+        if size <= max_cache_size:
+            _JSON_CACHE[key] = (stat.st_size, stat.st_mtime_ns, size, data)
+            _JSON_CACHE_STATS["size"] += size
+        # Remove the least recently used entries
+        while _JSON_CACHE_STATS["size"] > max_cache_size:
+            _JSON_CACHE_STATS["size"] -= _JSON_CACHE.popitem(last=False)[1][2]
+    return data
+
+
+def json_cache_info() -> dict[str, int]:
+    """Return the statistics of the cache of `read_json_cached()`.
+
+    Returns:
+        -   `dict[str, int]`: A dictionary containing the number of `"hits"`, `"misses"` and `"entries"` and the total estimated `"size"` (in bytes) of the cached data.
+    """
+    with _JSON_CACHE_LOCK:
+        return {**_JSON_CACHE_STATS, "entries": len(_JSON_CACHE)}
+
+
+def clear_json_cache() -> None:
+    """Remove all entries from the cache of `read_json_cached()` and reset its statistics."""
+    with _JSON_CACHE_LOCK:
+        _JSON_CACHE.clear()
+        _JSON_CACHE_STATS.update({"hits": 0, "misses": 0, "size": 0})
+
+
+def _freeze_json(data: object) -> object:
+    """Convert the dictionaries of decoded data into read-only dictionaries and the lists into tuples."""
+    if isinstance(data, dict):
+        return MappingProxyType(
+            {key: _freeze_json(value) for key, value in data.items()}
+        )
+    if isinstance(data, list):
+        return tuple(_freeze_json(value) for value in data)
+    return data
+
+
+def _estimate_size(data: object) -> int:
+    """Estimate the size (in bytes) of decoded data, the sum of the sizes of all (nested) objects."""
+    size: int = 0
+    stack: list = [data]
+    while stack:
+        value = stack.pop()
+        size += sys.getsizeof(value)
+        if isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return size
@@ -1,3 +1,11 @@
+import pickle
+import tempfile
+from collections import namedtuple
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from itertools import chain, islice
+from typing import TextIO
+
+
 def string_to_list(string: str, separator: str = "\n", limit: int = 0) -> list[str]:
     """Parse a string into a list.
 
@@ -9,6 +17,9 @@ def string_to_list(string: str, separator: str = "\n", limit: int = 0) -> list[s
     Returns:
         -   `list[str]`: A list of strings.
     """
+    # If a (positive) limit is set, stop parsing after the limit is reached
+    if limit > 0:
+        return list(islice(_iter_split(string, separator), limit))
     # Parse string into list
     list_str: list[str] = string.split(separator)
     # If limit is set
@@ -17,6 +28,30 @@ def string_to_list(string: str, separator: str = "\n", limit: int = 0) -> list[s
     return list_str
 
 
+def iter_string_list(
+    source: str | TextIO, separator: str = "\n", limit: int = 0, chunk_size: int = 65536
+) -> Iterator[str]:
+    """Lazily parse a string (or a text file object) into items.
+
+    The source is scanned for the separator (`str.find()`) only as far as the items are consumed, parsing stops when the limit is reached.
+    A file object (e.g. an opened file or `io.StringIO`) is read in chunks, without reading the whole file into memory.
+
+    Args:
+        -   `source` (`str | TextIO`): A string or a text file object to parse.
+        -   `separator` (`str`, optional): A string representing the separator within the given string. Defaults to `"\\n"`.
+        -   `limit` (`int`, optional): An integer representing the maximum number of returned items. Defaults to `0`.
+        -   `chunk_size` (`int`, optional): An integer representing the number of characters read from a file object at once. Defaults to `65536`.
+
+    Returns:
+        -   `Iterator[str]`: An iterator of strings.
+    """
+    items: Iterator[str] = _iter_split(source, separator, chunk_size)
+    # If limit is set
+    if limit > 0:
+        items = islice(items, limit)
+    yield from items
+
+
 def string_to_matrix(
     string: str,
     row_sep: str = "\n",
@@ -45,6 +80,34 @@ def string_to_matrix(
     return matrix
 
 
+def iter_string_matrix(
+    source: str | TextIO,
+    row_sep: str = "\n",
+    col_sep: str = ";",
+    row_limit: int = 0,
+    col_limit: int = 0,
+    chunk_size: int = 65536,
+) -> Iterator[list[str]]:
+    """Lazily parse a string (or a text file object) into the rows of a matrix. A matrix is a list of lists (2D-array).
+
+    The source is only parsed as far as the rows are consumed, parsing stops when the row limit is reached and each row is only split up to the column limit.
+    A file object (e.g. an opened file or `io.StringIO`) is read in chunks, without reading the whole file into memory.
+
+    Args:
+        -   `source` (`str | TextIO`): A string or a text file object to parse.
+        -   `row_sep` (`str`, optional): A string representing the row-separator within the given string. Defaults to `"\\n"`.
+        -   `col_sep` (`str`, optional): A string representing the column-separator within the given string. Defaults to `";"`.
+        -   `row_limit` (`int`, optional): An integer representing the maximum number of returned row items. Defaults to `0`.
+        -   `col_limit` (`int`, optional): An integer representing the maximum number of returned column items. Defaults to `0`.
+        -   `chunk_size` (`int`, optional): An integer representing the number of characters read from a file object at once. Defaults to `65536`.
+
+    Returns:
+        -   `Iterator[list[str]]`: An iterator of rows (lists of strings).
+    """
+    for row in iter_string_list(source, row_sep, row_limit, chunk_size):
+        yield string_to_list(row, col_sep, col_limit)
+
+
 def matrix_to_string(
     matrix: list[list], row_sep: str = "\n", col_sep: str = ";"
 ) -> str:
@@ -58,22 +121,49 @@ def matrix_to_string(
     Returns:
         -   `str`: A string parsed from the given matrix.
     """
-    # Concatenate all values for each row
-    string: str = col_sep.join(map(str, matrix[0]))
-    for row in matrix[1:]:
-        string += row_sep + col_sep.join(map(str, row))
-    return string
+    # Join the chunks of concatenated rows at once
+    return "".join(iter_matrix_string(matrix, row_sep, col_sep))
+
+
+def iter_matrix_string(
+    matrix: Iterable[list],
+    row_sep: str = "\n",
+    col_sep: str = ";",
+    chunk_rows: int = 1000,
+) -> Iterator[str]:
+    """Parse a matrix (or an iterable of rows) into chunks of a string. A matrix is a list of lists (2D-array).
+
+    The joined chunks are equal to the string of `matrix_to_string()`, write the chunks directly to a text stream with `stream.writelines(iter_matrix_string(...))`.
+
+    Args:
+        -   `matrix` (`Iterable[list]`): A matrix data structure, a list of list (2D-array), or an iterable (e.g. a generator) of rows.
+        -   `row_sep` (`str`, optional): A string representing the row-separator that will be used for the returned string. Defaults to `"\\n"`.
+        -   `col_sep` (`str`, optional): A string representing the column-separator that will be used for the returned string. Defaults to `";"`.
+        -   `chunk_rows` (`int`, optional): An integer representing the number of rows per chunk. Defaults to `1000`.
+
+    Returns:
+        -   `Iterator[str]`: An iterator of strings, the chunks of the string parsed from the given matrix.
+    """
+    rows: Iterator[list] = iter(matrix)
+    separator: str = ""
+    while batch := list(islice(rows, chunk_rows)):
+        # Concatenate all values for each row of the chunk
+        yield separator + row_sep.join(col_sep.join(map(str, row)) for row in batch)
+        separator = row_sep
 
 
 def matrix_to_dicts(
-    matrix: list[list], keys: list = [], filter_keys: list = []
+    matrix: list[list], keys: list = [], filter_keys: list = [], row_type: str = "dict"
 ) -> list[dict]:
-    """Parse a matrix into a list of dictionaries. A matrix is a list of lists (2D-array).
+    """Parse a matrix into a list of dictionaries (or compact records). A matrix is a list of lists (2D-array).
+
+    The `"namedtuple"` and `"slots"` records support both attribute and key access (e.g. `record.ID` and `record["ID"]`), `"tuple"` records are plain tuples of which the first one is the (shared) header.
 
     Args:
         -   `matrix` (`list[list]`): A matrix data structure, a list of list (2D-array).
         -   `keys` (`list`, optional): A list representing the headers of the matrix if the matrix does not contain headers. Defaults to `[]`.
         -   `filter_keys` (`list`, optional): A list representing the headers of columns to be filtered. Defaults to `[]`.
+        -   `row_type` (`str`, optional): A string representing the type of the records, `"dict"`, `"namedtuple"`, `"slots"` or `"tuple"`. Defaults to `"dict"`.
 
     Returns:
         -   `list[dict]`: A list of dictionaries parsed from the given matrix.
@@ -84,22 +174,97 @@ def matrix_to_dicts(
     if keys == []:
         keys = matrix[0]
         value_pos = 1
+    # Get compact records
+    if row_type != "dict":
+        columns: list = filter_keys if filter_keys != [] else list(keys)
+        indexes: list[int] = [list(keys).index(key) for key in columns]
+        make_record: Callable[[list], object] = _record_factory(columns, row_type)
+        if row_type == "tuple":
+            data.append(tuple(columns))
+        for row in matrix[value_pos:]:
+            data.append(make_record([row[idx] for idx in indexes]))
+        return data
+    # Get (filtered) keys and their positions
+    positions: dict = {key: idy for idy, key in enumerate(keys)}
+    if filter_keys != []:
+        positions = {key: positions[key] for key in filter_keys}
     # Get records
     for row in matrix[value_pos:]:
-        record: dict = {}
-        # Get values
-        for idy, key in enumerate(keys):
-            record[key] = row[idy]
-        # Add record
-        data.append(record)
-        if filter_keys != []:
-            # Filter record by given keys
-            data.append({key: record[key] for key in filter_keys})
-        else:
-            data.append(record)
+        # Get values and add record
+        data.append({key: row[idy] for key, idy in positions.items()})
     return data
 
 
+class RecordView(Mapping):
+    """A read-only dictionary view of a row of a matrix, without copying the values of the row.
+
+    The keys are mapped to the positions of the values within the row by a (shared) dictionary.
+
+    Args:
+        -   `row` (`list`): A list representing the row of the matrix.
+        -   `positions` (`dict`): A dictionary representing the position of the value within the row by key.
+    """
+
+    __slots__ = ("_row", "_positions")
+
+    def __init__(self, row: list, positions: dict) -> None:
+        self._row: list = row
+        self._positions: dict = positions
+
+    def __getitem__(self, key):
+        return self._row[self._positions[key]]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __repr__(self) -> str:
+        return f"RecordView({dict(self)!r})"
+
+
+class TableView(Sequence):
+    """A read-only list view of the records (`RecordView`) of a matrix, without copying the matrix. A matrix is a list of lists (2D-array).
+
+    Creating the view takes constant time (independent of the number of rows), a record view is created when a record is accessed and only the accessed values are read.
+
+    Args:
+        -   `matrix` (`list[list]`): A matrix data structure, a list of list (2D-array).
+        -   `keys` (`list`, optional): A list representing the headers of the matrix if the matrix does not contain headers. Defaults to `[]`.
+        -   `filter_keys` (`list`, optional): A list representing the headers of columns to be included in the records (projection). Defaults to `[]`.
+    """
+
+    def __init__(
+        self, matrix: list[list], keys: list = [], filter_keys: list = []
+    ) -> None:
+        self._matrix: list[list] = matrix
+        # Get keys
+        self._value_pos: int = 0
+        if keys == []:
+            keys = matrix[0] if matrix else []
+            self._value_pos = 1
+        self._positions: dict = {key: idy for idy, key in enumerate(keys)}
+        if filter_keys != []:
+            self._positions = {key: self._positions[key] for key in filter_keys}
+
+    def __getitem__(self, index: int | slice) -> RecordView | list[RecordView]:
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+        return RecordView(self._matrix[index + self._value_pos], self._positions)
+
+    def __len__(self) -> int:
+        return max(len(self._matrix) - self._value_pos, 0)
+
+    def keys(self) -> list:
+        """Return the (filtered) keys of the records."""
+        return list(self._positions)
+
+
 def dicts_to_matrix(data: list[dict], default: str = "") -> list[list]:
     """Parse a list of dictionaries into a matrix. A matrix is a list of lists (2D-array).
 
@@ -123,6 +288,53 @@ def dicts_to_matrix(data: list[dict], default: str = "") -> list[list]:
     return matrix
 
 
+def iter_dicts_to_matrix(
+    data: Iterable[dict],
+    keys: list = [],
+    default: str = "",
+    spool_dir: str | None = None,
+) -> Iterator[list]:
+    """Lazily parse an iterable of dictionaries into the rows of a matrix, of which the first row contains the keys. A matrix is a list of lists (2D-array).
+
+    Unlike `dicts_to_matrix()`, the keys are the union of the keys of all dictionaries (in order of appearance). To discover them, the dictionaries are spooled to a temporary file on the first pass and read back on the second pass, so only one dictionary is kept in memory at a time. If `keys` is given, the dictionaries are streamed directly (single pass) and other keys are ignored. The rows can be passed directly to `write_csv()`.
+
+    Args:
+        -   `data` (`Iterable[dict]`): An iterable (e.g. a generator) of dictionaries.
+        -   `keys` (`list`, optional): A list representing the keys (columns) of the matrix, skipping the key discovery. Defaults to `[]`.
+        -   `default` (`str`, optional): A string representing the value given to keys that do not exist. Defaults to `""`.
+        -   `spool_dir` (`str | None`, optional): A string representing the directory of the temporary spool file. Defaults to `None` (the system's temporary directory).
+
+    Returns:
+        -   `Iterator[list]`: An iterator of lists, the keys followed by the values of each dictionary.
+    """
+    if keys != []:
+        # Stream the values of the given keys
+        yield list(keys)
+        for record in data:
+            yield [record.get(key, default) for key in keys]
+        return
+    with tempfile.TemporaryFile(dir=spool_dir) as spool:
+        # Spool the dictionaries and get the keys (first pass)
+        found: dict = {}
+        pickler = pickle.Pickler(spool, protocol=pickle.HIGHEST_PROTOCOL)
+        for record in data:
+            found.update(dict.fromkeys(record))
+            pickler.dump(record)
+            # Do not keep references to the spooled dictionaries
+            pickler.clear_memo()
+        keys = list(found)
+        yield keys
+        # Read the dictionaries back (second pass)
+        spool.seek(0)
+        while True:
+            try:
+                # A new unpickler per dictionary, to not keep references to the read dictionaries
+                record = pickle.load(spool)
+            except EOFError:
+                break
+            yield [record.get(key, default) for key in keys]
+
+
 def string_to_dicts(
     string: str,
     row_sep: str = "\n",
@@ -130,8 +342,11 @@ def string_to_dicts(
     row_limit: int = 0,
     keys: list = [],
     filter_keys: list = [],
+    row_type: str = "dict",
 ) -> list[dict]:
-    """Parse a string into a list of dictionaries.
+    """Parse a string into a list of dictionaries (or compact records).
+
+    The `"namedtuple"` and `"slots"` records support both attribute and key access (e.g. `record.ID` and `record["ID"]`), `"tuple"` records are plain tuples of which the first one is the (shared) header.
 
     Args:
         -   `string` (`str`): A string to parse.
@@ -140,6 +355,7 @@ def string_to_dicts(
         -   `row_limit` (`int`, optional): An integer representing the maximum number of returned row items. Defaults to `0`.
         -   `keys` (`list`, optional): A list representing the headers of the matrix if the matrix does not contain headers. Defaults to `[]`.
         -   `filter_keys` (`list`, optional): A list representing the headers of columns to be filtered. Defaults to `[]`.
+        -   `row_type` (`str`, optional): A string representing the type of the records, `"dict"`, `"namedtuple"`, `"slots"` or `"tuple"`. Defaults to `"dict"`.
 
     Returns:
         -   `list[dict]`: A list of dictionaries from the given string.
@@ -147,7 +363,7 @@ def string_to_dicts(
     # Parse string into matrix
     matrix: list[list[str]] = string_to_matrix(string, row_sep, col_sep, row_limit)
     # Parse matrix into dictionaries
-    return matrix_to_dicts(matrix, keys, filter_keys)
+    return matrix_to_dicts(matrix, keys, filter_keys, row_type)
 
 
 def dicts_to_string(
@@ -164,7 +380,148 @@ def dicts_to_string(
     Returns:
         -   `str`: A string parsed from the given list of dictionaries.
     """
-    # Parse dictionaries into matrix
-    matrix: list[list] = dicts_to_matrix(data, default)
-    # Parse matrix into string
-    return matrix_to_string(matrix, row_sep, col_sep)
+    # Join the chunks of the parsed dictionaries at once
+    return "".join(iter_dicts_string(data, row_sep, col_sep, default))
+
+
+def iter_dicts_string(
+    data: Iterable[dict],
+    row_sep: str = "\n",
+    col_sep: str = ";",
+    default: str = "",
+    keys: list | None = None,
+    chunk_rows: int = 1000,
+) -> Iterator[str]:
+    """Parse a list (or an iterable) of dictionaries into chunks of a string, without creating an intermediate matrix.
+
+    The joined chunks are equal to the string of `dicts_to_string()`, write the chunks directly to a text stream with `stream.writelines(iter_dicts_string(...))`.
+
+    Args:
+        -   `data` (`Iterable[dict]`): A list of dictionaries, or an iterable (e.g. a generator) of dictionaries.
+        -   `row_sep` (`str`, optional): An optional string representing the row-separator within the given string. Defaults to `"\\n"`.
+        -   `col_sep` (`str`, optional): An optional string representing the column-separator within the given string. Defaults to `";"`.
+        -   `default` (`str`, optional): An optional string representing the value given to keys that do not exist. Defaults to `""`.
+        -   `keys` (`list | None`, optional): A list representing the headers (keys) of the string, `None` uses the keys of the first dictionary. Defaults to `None`.
+        -   `chunk_rows` (`int`, optional): An integer representing the number of rows per chunk. Defaults to `1000`.
+
+    Returns:
+        -   `Iterator[str]`: An iterator of strings, the chunks of the string parsed from the given dictionaries.
+    """
+    records: Iterator[dict] = iter(data)
+    first: dict | None = next(records, None)
+    if first is None:
+        return
+    # Get keys
+    if keys is None:
+        keys = list(first.keys())
+    # Get values
+    rows: Iterator[list] = (
+        [record.get(key, default) for key in keys] for record in chain([first], records)
+    )
+    yield from iter_matrix_string(chain([keys], rows), row_sep, col_sep, chunk_rows)
+
+
+def _record_factory(keys: list[str], row_type: str) -> Callable[[list], object]:
+    """Return a callable creating a record of the given type from a list of values (in the order of the keys)."""
+    if row_type == "dict":
+        return lambda values: dict(zip(keys, values))
+    if row_type == "tuple":
+        return tuple
+    if row_type == "namedtuple":
+        return _namedtuple_record(keys)._make
+    if row_type == "slots":
+        return _slots_record(keys)
+    raise ValueError(f"Unknown row type '{row_type}'")
+
+
+def _namedtuple_record(keys: list[str]) -> type:
+    """Create a named tuple record class which also supports key access (e.g. `record["ID"]`)."""
+    base: type = namedtuple("Record", keys, rename=True)
+    index: dict[str, int] = {key: idx for idx, key in enumerate(keys)}
+
+    def __getitem__(self, key: str | int | slice):
+        if isinstance(key, str):
+            key = index[key]
+        return tuple.__getitem__(self, key)
+
+    def _asdict(self) -> dict:
+        return dict(zip(keys, self))
+
+    return type(
+        "Record",
+        (base,),
+        {"__slots__": (), "__getitem__": __getitem__, "_asdict": _asdict},
+    )
+
+
+def _slots_record(keys: list[str]) -> type:
+    """Create a `__slots__` record class which supports attribute and key access (e.g. `record["ID"]`)."""
+    # Use the (renamed) field names of a named tuple as valid attribute names
+    names: tuple[str, ...] = namedtuple("Record", keys, rename=True)._fields
+    attributes: dict[str, str] = dict(zip(keys, names))
+
+    def __init__(self, values: list) -> None:
+        for name, value in zip(names, values):
+            setattr(self, name, value)
+
+    def __getitem__(self, key: str):
+        return getattr(self, attributes[key])
+
+    def __iter__(self) -> Iterator:
+        return (getattr(self, name) for name in names)
+
+    def __len__(self) -> int:
+        return len(names)
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and tuple(self) == tuple(other)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in zip(names, self))
+        return f"Record({fields})"
+
+    def _asdict(self) -> dict:
+        return dict(zip(keys, self))
+
+    return type(
+        "Record",
+        (),
+        {
+            "__slots__": names,
+            "__init__": __init__,
+            "__getitem__": __getitem__,
+            "__iter__": __iter__,
+            "__len__": __len__,
+            "__eq__": __eq__,
+            "__hash__": None,
+            "__repr__": __repr__,
+            "_asdict": _asdict,
+        },
+    )
+
+
+def _iter_split(
+    source: str | TextIO, separator: str, chunk_size: int = 65536
+) -> Iterator[str]:
+    """Split a string (or a text file object, read in chunks) on the separator, item by item (like `str.split()`)."""
+    if not separator:
+        raise ValueError("empty separator")
+    if isinstance(source, str):
+        start: int = 0
+        while (end := source.find(separator, start)) != -1:
+            yield source[start:end]
+            start = end + len(separator)
+        yield source[start:]
+        return
+    buffer: str = ""
+    while chunk := source.read(chunk_size):
+        # The buffer has no complete separator, only search where the chunk can complete one
+        position: int = max(0, len(buffer) - len(separator) + 1)
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(separator, position)) != -1:
+            yield buffer[start:end]
+            start = position = end + len(separator)
+        # Keep the incomplete last item (and a partial separator) for the next chunk
+        buffer = buffer[start:]
+    yield buffer